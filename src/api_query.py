@@ -11,6 +11,8 @@ import typing
 import zlib
 from typing import TypedDict
 
+from src.ledger import decompress_fact_content
+
 logger = logging.getLogger(__name__)
 
 
@@ -77,11 +79,9 @@ def search_ledger_for_api(
         for row in cursor.fetchall():
             r = dict(row)
             try:
-                r["fact_content"] = zlib.decompress(r["fact_content"]).decode(
-                    "utf-8"
-                )
+                r["fact_content"] = decompress_fact_content(r["fact_content"])
                 results.append(r)  # type: ignore[arg-type]
-            except (TypeError, zlib.error):
+            except (TypeError, ValueError, zlib.error):
                 logger.warning(
                     f"[API Query] Could not decompress fact {r['fact_id'][:8]}. Skipping or keeping compressed."
                 )
@@ -97,6 +97,56 @@ def search_ledger_for_api(
             conn.close()
 
 
+# Stay under SQLite's default bound-parameter limit (999).
+_ID_LOOKUP_CHUNK_SIZE = 900
+
+
+def get_facts_by_ids(
+    fact_ids: list[str],
+    include_disputed: bool = False,
+    db_path: str = "axiom_ledger.db",
+) -> list[FactResult]:
+    """Fetch specific facts by primary key, in chunks of at most 900 IDs."""
+    ids = list(dict.fromkeys(fid for fid in fact_ids if isinstance(fid, str)))
+    if not ids:
+        return []
+    conn = None
+
+    try:
+        conn = sqlite3.connect(db_path)
+        conn.row_factory = sqlite3.Row
+        cursor = conn.cursor()
+
+        results: list[FactResult] = []
+        for i in range(0, len(ids), _ID_LOOKUP_CHUNK_SIZE):
+            chunk = ids[i : i + _ID_LOOKUP_CHUNK_SIZE]
+            placeholders = ",".join("?" * len(chunk))
+            query = f"SELECT fact_id, fact_content, status, trust_score, source_url, ingest_timestamp_utc FROM facts WHERE fact_id IN ({placeholders})"  # noqa: S608
+            if not include_disputed:
+                query += " AND status != 'disputed'"
+            cursor.execute(query, chunk)
+            for row in cursor.fetchall():
+                r = dict(row)
+                try:
+                    r["fact_content"] = decompress_fact_content(
+                        r["fact_content"]
+                    )
+                    results.append(r)  # type: ignore[arg-type]
+                except (TypeError, ValueError, zlib.error):
+                    logger.warning(
+                        f"[API Query] Could not decompress fact {r['fact_id'][:8]}. Skipping."
+                    )
+
+        return results
+
+    except sqlite3.Error as e:
+        logger.error(f"[Ledger Query] Database error: {e}")
+        return []
+    finally:
+        if conn:
+            conn.close()
+
+
 def query_lexical_mesh(
     search_term: str, db_path: str = "axiom_ledger.db"
 ) -> LexicalMeshResult | None:
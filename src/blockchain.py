@@ -288,6 +288,119 @@ def append_block(
             conn.close()
 
 
+def append_blocks(
+    blocks: list[dict[str, Any]],
+    db_path: str | None = None,
+    conn: sqlite3.Connection | None = None,
+) -> int:
+    """Append consecutive peer blocks in one transaction.
+
+    Blocks are validated in order against the running head, exactly as
+    append_block would; the valid prefix is inserted and committed once.
+    Returns how many blocks were appended, so a result below len(blocks)
+    means the chain diverged (or a block was malformed) at that index.
+    """
+    if not blocks:
+        return 0
+
+    # Normalize peer data before taking the write lock; a malformed block
+    # ends the batch there, like a divergence.
+    normalized: list[dict[str, Any]] = []
+    for blk_wire in blocks:
+        try:
+            normalized.append(_normalize_block_from_wire(blk_wire))
+        except (AttributeError, KeyError, TypeError, ValueError) as e:
+            logger.warning(
+                "[P2P Chain] Append stopped: malformed peer block (%s).", e
+            )
+            break
+    if not normalized:
+        return 0
+
+    own_conn = conn is None
+    if conn is None:
+        if db_path is None:
+            db_path = "axiom_ledger.db"
+        conn = sqlite3.connect(db_path)
+
+    try:
+        ensure_genesis(conn)
+        cursor = conn.cursor()
+        # Hold the write lock from the head read through the insert, so a
+        # locally created block cannot slip in between.
+        cursor.execute("BEGIN IMMEDIATE")
+        head = get_chain_head(db_path=db_path, conn=conn)
+        if head is None:
+            logger.warning("[P2P Chain] Append failed: no local chain head.")
+            conn.rollback()
+            return 0
+        prev_id, prev_height = head
+
+        appended = 0
+        for block in normalized:
+            if (
+                block["previous_block_id"] != prev_id
+                or block["height"] != prev_height + 1
+            ):
+                logger.warning(
+                    "[P2P Chain] Append failed: chain divergence. Peer block expects previous=%s height=%s; "
+                    "our head is %s height=%s. Chains have diverged (e.g. different DBs or one node created blocks alone).",
+                    block.get("previous_block_id", "")[:16],
+                    block.get("height"),
+                    prev_id[:16] if prev_id else None,
+                    prev_height,
+                )
+                break
+            ok, reason = validate_block(
+                block["block_id"],
+                block["previous_block_id"],
+                block["height"],
+                block["created_at_utc"],
+                block["fact_ids"],
+                prev_id,
+                prev_height + 1,
+            )
+            if not ok:
+                logger.warning(
+                    "[P2P Chain] Append failed: block validation failed (%s).",
+                    reason,
+                )
+                break
+            try:
+                cursor.execute(
+                    """
+                    INSERT INTO blocks (block_id, previous_block_id, height, created_at_utc, fact_ids)
+                    VALUES (?, ?, ?, ?, ?)
+                    """,
+                    (
+                        block["block_id"],
+                        block["previous_block_id"],
+                        block["height"],
+                        block["created_at_utc"],
+                        json.dumps(block["fact_ids"]),
+                    ),
+                )
+            except sqlite3.IntegrityError:
+                # Keep the blocks already inserted, as the per-block path
+                # would have.
+                logger.warning(
+                    "[P2P Chain] Append failed: block already exists (duplicate block_id)."
+                )
+                break
+            appended += 1
+            prev_id, prev_height = block["block_id"], block["height"]
+
+        conn.commit()
+        return appended
+    finally:
+        # Never leave the transaction (and its write lock) open on a
+        # caller's connection, whatever went wrong above.
+        if conn.in_transaction:
+            conn.rollback()
+        if own_conn:
+            conn.close()
+
+
 def get_blocks_after(
     height: int,
     db_path: str | None = None,
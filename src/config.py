@@ -34,6 +34,38 @@ REQUIRED_CORROBORATING_DOMAINS = _int(
     3,
 )
 
+# --- Fact identity ---
+# Hash used to derive new fact IDs: "sha256" (default) or "blake2b"
+# (BLAKE2b-256, faster). Must be the same on every node of a network: the
+# same fact hashed differently gets two IDs, so cross-node deduplication
+# stops working. Nodes on older releases only verify sha256 IDs.
+FACT_HASH_ALGO = os.environ.get("AXIOM_FACT_HASH_ALGO", "sha256").lower()
+
+# --- Fact storage ---
+# Codec for new fact_content BLOBs: "zlib" (default) or "zstd" (faster
+# decode; needs the zstandard package). Existing rows stay readable either way.
+FACT_COMPRESSION = os.environ.get("AXIOM_FACT_COMPRESSION", "zlib").lower()
+
+# --- Peer sync ---
+# Concurrent /get_facts_by_id requests per sync. Higher = faster catch-up,
+# more load on the peer being synced from.
+SYNC_FETCH_WORKERS = _int("AXIOM_SYNC_FETCH_WORKERS", 8)
+
+# --- Feed discovery ---
+# RSS feeds fetched concurrently by the Pathfinder and Zeitgeist engine.
+FEED_FETCH_WORKERS = _int("AXIOM_FEED_FETCH_WORKERS", 8)
+# Seconds a parsed feed is shared between consumers before re-polling.
+FEED_CACHE_TTL = _float("AXIOM_FEED_CACHE_TTL", 60.0)
+# SQLite file keeping feed ETag / Last-Modified validators across restarts;
+# by default it sits beside the ledger named by AXIOM_DB_PATH.
+FEED_CACHE_DB = os.environ.get(
+    "AXIOM_FEED_CACHE_DB",
+    os.path.join(
+        os.path.dirname(os.environ.get("AXIOM_DB_PATH", "")),
+        "axiom_feed_cache.db",
+    ),
+)
+
 # --- Peer reputation ---
 # Initial reputation for a newly discovered peer. Lower = trust earned slower.
 PEER_REP_INITIAL = _float("AXIOM_PEER_REP_INITIAL", 0.2)
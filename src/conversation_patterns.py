@@ -4,8 +4,21 @@ This module provides rule-based pattern matching for interpreting user queries
 and generating appropriate responses. It supports slot-based templates.
 """
 
+import contextlib
+import hashlib
+import json
+import logging
+import os
 import re
-from dataclasses import dataclass
+from dataclasses import dataclass, field
+
+logger = logging.getLogger(__name__)
+
+# Translated regex sources from a previous run, keyed by a fingerprint of the
+# seed templates so edits to seed_patterns() invalidate the cache. Unless
+# overridden, the file sits beside the node's ledger (see pattern_cache_path).
+PATTERN_CACHE_PATH = os.environ.get("AXIOM_PATTERN_CACHE_PATH")
+PATTERN_CACHE_NAME = ".axiom_patterns.json"
 
 
 def _normalize(text: str) -> str:
@@ -21,6 +34,14 @@ class ConversationPattern:
     response: str
     weight: float = 1.0
     regex: re.Pattern[str] | None = None
+    # Derived from raw_template once so match_query never re-normalizes it.
+    template_norm: str = field(init=False, repr=False, default="")
+    has_slots: bool = field(init=False, repr=False, default=False)
+
+    def __post_init__(self) -> None:
+        """Precompute the normalized template used for literal matching."""
+        self.template_norm = _normalize(self.raw_template)
+        self.has_slots = "<" in self.raw_template
 
     def compile(self) -> None:
         """Compile the raw_template into a regex.
@@ -140,6 +161,75 @@ def compile_patterns(patterns: list[ConversationPattern]) -> None:
         p.compile()
 
 
+def _patterns_fingerprint(patterns: list[ConversationPattern]) -> str:
+    """Hash the templates so a stale cache is never applied to new seeds."""
+    h = hashlib.sha256()
+    for p in patterns:
+        h.update(p.raw_template.encode("utf-8"))
+        h.update(b"\0")
+    return h.hexdigest()
+
+
+def pattern_cache_path(db_path: str) -> str:
+    """Return where compiled patterns are cached for the ledger at db_path."""
+    if PATTERN_CACHE_PATH:
+        return PATTERN_CACHE_PATH
+    return os.path.join(
+        os.path.dirname(os.path.abspath(db_path)), PATTERN_CACHE_NAME
+    )
+
+
+def save_compiled_patterns(
+    patterns: list[ConversationPattern], path: str
+) -> None:
+    """Persist the compiled regex sources so the next start can skip compilation."""
+    if any(p.regex is None for p in patterns):
+        return
+    payload = {
+        "fingerprint": _patterns_fingerprint(patterns),
+        "regexes": [p.regex.pattern for p in patterns if p.regex is not None],
+    }
+    tmp_path = f"{path}.tmp"
+    try:
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(payload, f)
+        os.replace(tmp_path, path)
+    except OSError as e:
+        logger.debug("[Conversation] Could not persist pattern cache: %s", e)
+        with contextlib.suppress(OSError):
+            os.remove(tmp_path)
+
+
+def load_compiled_patterns(
+    patterns: list[ConversationPattern], path: str
+) -> bool:
+    """Attach cached regexes to patterns in-place.
+
+    Returns True only if the cache matches these templates exactly.
+    """
+    try:
+        with open(path, encoding="utf-8") as f:
+            payload = json.load(f)
+    except (OSError, ValueError):
+        return False
+    if not isinstance(payload, dict):
+        return False
+    regexes = payload.get("regexes")
+    if (
+        payload.get("fingerprint") != _patterns_fingerprint(patterns)
+        or not isinstance(regexes, list)
+        or len(regexes) != len(patterns)
+    ):
+        return False
+    try:
+        compiled = [re.compile(r, re.IGNORECASE) for r in regexes]
+    except (re.error, TypeError):
+        return False
+    for p, regex in zip(patterns, compiled, strict=True):
+        p.regex = regex
+    return True
+
+
 def _lookup_topic_in_ledger(
     topic: str, db_path: str = "axiom_ledger.db"
 ) -> str:
@@ -210,7 +300,7 @@ def match_query(
 
     for p in patterns:
         base = p.weight or 1.0
-        template_norm = _normalize(p.raw_template)
+        template_norm = p.template_norm
 
         # Exact match on normalized text.
         if q_norm == template_norm:
@@ -235,11 +325,7 @@ def match_query(
                 continue
 
         # Simple containment only for non-slot templates.
-        if (
-            "<" not in p.raw_template
-            and template_norm
-            and template_norm in q_norm
-        ):
+        if not p.has_slots and template_norm and template_norm in q_norm:
             score = 0.7 * base
             if score > best_score:
                 best_score = score
@@ -9,17 +9,17 @@ within the knowledge graph.
 # Axiom - crucible.py
 # Copyright (C) 2026 The Axiom Contributors
 
-import hashlib
 import logging
 import re
-import zlib
 from typing import Any
 
 from src.axiom_model_loader import load_nlp_model
 from src.ledger import (
+    decompress_fact_content,
     find_similar_fact_from_different_domain,
     get_all_facts_for_analysis,
     insert_uncorroborated_fact,
+    make_fact_id,
     mark_facts_as_disputed,
     update_fact_corroboration,
     update_lexical_atom,
@@ -256,7 +256,7 @@ def _check_for_contradiction(
 
         # DECOMPRESS BLOB FOR ANALYSIS
         try:
-            decompressed_content = zlib.decompress(content).decode("utf-8")
+            decompressed_content = decompress_fact_content(content)
         except Exception as e:
             logger.error(f"Decompression failed: {e}")
             # If decompression fails (e.g., checking an old/corrupt record), skip it.
@@ -354,7 +354,7 @@ def extract_facts_from_text(
             update_fact_corroboration(similar_fact["fact_id"], source_url)
             continue
 
-        fact_id = hashlib.sha256(raw_sent.encode("utf-8")).hexdigest()
+        fact_id = make_fact_id(raw_sent)
 
         # --- GENERATE ADL & fragment metadata ---
         adl_summary = _generate_adl_summary(sent_doc)
@@ -5,16 +5,17 @@ These are designed for small, throttled idle tasks, not full offline jobs.
 
 import hashlib
 import sqlite3
-import zlib
 from dataclasses import dataclass
 
+from src.ledger import decompress_fact_content
+
 
 def _safe_text(raw: bytes | bytearray | str | None) -> str:
     if raw is None:
         return ""
     if isinstance(raw, (bytes, bytearray)):
         try:
-            return zlib.decompress(raw).decode("utf-8")
+            return decompress_fact_content(raw)
         except Exception:
             try:
                 return raw.decode("utf-8", errors="ignore")
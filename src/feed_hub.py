@@ -0,0 +1,249 @@
+"""Axiom - feed_hub.py
+
+Single place where RSS feeds are downloaded and parsed. The Pathfinder and
+the Zeitgeist engine poll overlapping feed lists; each unique feed is fetched
+once per FEED_CACHE_TTL and the parsed result is shared.
+"""
+
+import contextlib
+import logging
+import sqlite3
+import threading
+import time
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any
+from urllib.parse import urlsplit
+
+import feedparser
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+from src.config import FEED_CACHE_DB, FEED_CACHE_TTL, FEED_FETCH_WORKERS
+
+logger = logging.getLogger(__name__)
+
+# (connect, read) seconds for one feed download.
+FEED_TIMEOUT = (5, 10)
+
+# Shared so feed downloads reuse keep-alive connections and TLS sessions.
+_SESSION = requests.Session()
+_SESSION.headers["User-Agent"] = (
+    "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) "
+    "AppleWebKit/537.36 (KHTML, like Gecko) Chrome/121.0.0.0 Safari/537.36"
+)
+# One keep-alive slot per fetch worker. Gateway errors get two quick
+# retries; connect failures and read timeouts are not retried, so a dead or
+# stalled host costs at most one FEED_TIMEOUT.
+_ADAPTER = HTTPAdapter(
+    pool_connections=32,
+    pool_maxsize=max(FEED_FETCH_WORKERS, 10),
+    max_retries=Retry(
+        total=2,
+        connect=0,
+        read=0,
+        backoff_factor=0.3,
+        status_forcelist=(502, 503, 504),
+        raise_on_status=False,
+    ),
+)
+_SESSION.mount("https://", _ADAPTER)
+_SESSION.mount("http://", _ADAPTER)
+
+# Hosts that fail this many fetches in a row, and feed URLs that fail this
+# many times in a row on a host that does answer (HTTP errors, pages that
+# are not feeds), are skipped for a while; each further failure doubles the
+# pause, up to the cap.
+FAILURE_THRESHOLD = 3
+BACKOFF_SECONDS = 300.0
+BACKOFF_MAX_SECONDS = 3600.0
+
+# url -> (etag, last_modified, parsed feed), for conditional GETs.
+_validators: dict[str, tuple[str | None, str | None, Any]] = {}
+# url -> (monotonic fetch time, parsed feed or None), shared between callers.
+_recent: dict[str, tuple[float, Any]] = {}
+# host or feed URL -> consecutive failures, and -> monotonic time it may
+# retry. Hosts never contain "://", so the two kinds of key cannot collide.
+_failures: Counter[str] = Counter()
+_retry_at: dict[str, float] = {}
+_lock = threading.Lock()
+
+
+def _available(key: str) -> bool:
+    """Return False while a repeatedly failing host or feed is backed off."""
+    with _lock:
+        return time.monotonic() >= _retry_at.get(key, 0.0)
+
+
+def _record_result(key: str, ok: bool) -> None:
+    """Reset a host's or feed's failure streak, or extend it and maybe back off."""
+    with _lock:
+        if ok:
+            _failures.pop(key, None)
+            _retry_at.pop(key, None)
+            return
+        _failures[key] += 1
+        excess = _failures[key] - FAILURE_THRESHOLD
+        if excess >= 0:
+            delay = min(BACKOFF_SECONDS * 2**excess, BACKOFF_MAX_SECONDS)
+            _retry_at[key] = time.monotonic() + delay
+
+
+def _load_stored(feed_url: str) -> tuple[str | None, str | None, bytes] | None:
+    """Read a feed's persisted (etag, last_modified, body), if any."""
+    try:
+        conn = sqlite3.connect(FEED_CACHE_DB, timeout=5)
+        try:
+            return conn.execute(
+                "SELECT etag, last_modified, body FROM feed_cache WHERE url = ?",
+                (feed_url,),
+            ).fetchone()
+        finally:
+            conn.close()
+    except sqlite3.Error:
+        return None
+
+
+def _store(
+    feed_url: str, etag: str | None, modified: str | None, body: bytes
+) -> None:
+    """Persist a feed's validators and body so 304s survive a restart."""
+    with contextlib.suppress(sqlite3.Error):
+        conn = sqlite3.connect(FEED_CACHE_DB, timeout=5)
+        try:
+            with conn:
+                conn.execute(
+                    """
+                    CREATE TABLE IF NOT EXISTS feed_cache (
+                        url TEXT PRIMARY KEY,
+                        etag TEXT,
+                        last_modified TEXT,
+                        body BLOB NOT NULL
+                    )
+                    """
+                )
+                conn.execute(
+                    "INSERT OR REPLACE INTO feed_cache VALUES (?, ?, ?, ?)",
+                    (feed_url, etag, modified, body),
+                )
+        finally:
+            conn.close()
+
+
+def _parse_bytes(body: bytes, headers: dict[str, str]) -> Any:
+    """Parse feed bytes; feedparser wants lower-cased header names."""
+    return feedparser.parse(
+        body, response_headers={k.lower(): v for k, v in headers.items()}
+    )
+
+
+def _parse_feed(feed_url: str) -> Any:
+    """Download and parse one RSS feed, or None if it failed.
+
+    The download goes through the shared keep-alive session and feedparser
+    only sees the bytes. Repeat fetches send the feed's ETag /
+    Last-Modified; a 304 reply reuses the copy parsed last time. The
+    validators and body are also kept in FEED_CACHE_DB, so the first poll
+    after a restart can still be answered with a 304.
+    """
+    host = urlsplit(feed_url).hostname or feed_url
+    if not _available(host):
+        logger.debug("[FeedHub] Skipping backed-off host %s", host)
+        return None
+    if not _available(feed_url):
+        logger.debug("[FeedHub] Skipping backed-off feed %s", feed_url)
+        return None
+    with _lock:
+        cached = _validators.get(feed_url)
+    stored = None
+    if cached is None:
+        stored = _load_stored(feed_url)
+    headers = {}
+    validators = cached or stored
+    if validators is not None:
+        etag, modified, _ = validators
+        if etag:
+            headers["If-None-Match"] = etag
+        if modified:
+            headers["If-Modified-Since"] = modified
+    try:
+        resp = _SESSION.get(feed_url, timeout=FEED_TIMEOUT, headers=headers)
+    except requests.RequestException as e:
+        _record_result(host, ok=False)
+        logger.debug("[FeedHub] Failed to fetch feed %s: %s", feed_url, e)
+        return None
+    # The host answered; an error status is held against this feed only.
+    _record_result(host, ok=True)
+    try:
+        resp.raise_for_status()
+    except requests.HTTPError as e:
+        _record_result(feed_url, ok=False)
+        logger.debug("[FeedHub] Failed to fetch feed %s: %s", feed_url, e)
+        return None
+    if resp.status_code == 304:
+        # An unchanged feed is a good fetch; it ends any failure streak.
+        _record_result(feed_url, ok=True)
+        if cached is not None:
+            return cached[2]
+        if stored is not None:
+            etag, modified, body = stored
+            try:
+                feed = _parse_bytes(body, {})
+            except Exception as e:
+                logger.debug(
+                    "[FeedHub] Failed to parse stored feed %s: %s", feed_url, e
+                )
+                return None
+            with _lock:
+                _validators[feed_url] = (etag, modified, feed)
+            return feed
+    try:
+        feed = _parse_bytes(resp.content, dict(resp.headers))
+    except Exception as e:
+        _record_result(feed_url, ok=False)
+        logger.debug("[FeedHub] Failed to parse feed %s: %s", feed_url, e)
+        return None
+    # A malformed document with no entries (typically an HTML page at a
+    # moved feed URL) counts as a failure; a feed with minor errors does not.
+    _record_result(feed_url, ok=not (feed.bozo and not feed.entries))
+    etag = resp.headers.get("ETag")
+    modified = resp.headers.get("Last-Modified")
+    if etag or modified:
+        with _lock:
+            _validators[feed_url] = (etag, modified, feed)
+        _store(feed_url, etag, modified, resp.content)
+    return feed
+
+
+def get_feeds(
+    feed_urls: list[str], ttl: float = FEED_CACHE_TTL
+) -> dict[str, Any]:
+    """Return {url: parsed feed or None} for each URL, in the given order.
+
+    Feeds parsed less than `ttl` seconds ago are reused; the rest are
+    downloaded concurrently.
+    """
+    now = time.monotonic()
+    results: dict[str, Any] = {}
+    stale: list[str] = []
+    with _lock:
+        for url in dict.fromkeys(feed_urls):
+            hit = _recent.get(url)
+            if hit is not None and now - hit[0] < ttl:
+                results[url] = hit[1]
+            else:
+                stale.append(url)
+
+    if stale:
+        with ThreadPoolExecutor(
+            max_workers=min(FEED_FETCH_WORKERS, len(stale))
+        ) as executor:
+            fetched = list(executor.map(_parse_feed, stale))
+        fetched_at = time.monotonic()
+        with _lock:
+            for url, feed in zip(stale, fetched, strict=True):
+                _recent[url] = (fetched_at, feed)
+                results[url] = feed
+
+    return {url: results[url] for url in feed_urls}
@@ -4,6 +4,8 @@ import sqlite3
 import zlib
 from typing import Any  # Added for type hinting consistency
 
+from src.ledger import decompress_fact_content
+
 # DB_NAME removed. All functions now require db_path.
 
 
@@ -14,7 +16,7 @@ def _decompress_fact_content(raw: bytes | str | None) -> str:
     if isinstance(raw, str):
         return raw
     try:
-        return zlib.decompress(raw).decode("utf-8")
+        return decompress_fact_content(raw)
     except (TypeError, zlib.error, ValueError):
         return "[unable to decompress]"
 
@@ -7,6 +7,7 @@ import zlib
 from typing import Any
 
 from src.axiom_model_loader import load_nlp_model
+from src.ledger import decompress_fact_content
 from src.synthesizer import get_weighted_entities
 
 logger = logging.getLogger(__name__)
@@ -150,11 +151,7 @@ def think(
         for row in rows:
             raw = row["fact_content"]
             try:
-                text = (
-                    zlib.decompress(raw).decode("utf-8")
-                    if isinstance(raw, (bytes, bytearray))
-                    else str(raw)
-                )
+                text = decompress_fact_content(raw)
             except (zlib.error, TypeError, ValueError):
                 continue
 
@@ -1,20 +1,244 @@
 """Construct extraction into a ledger database"""
 
 import contextlib
+import functools
+import hashlib
 import logging
 import sqlite3
+import threading
 import zlib
+from collections.abc import Iterator
 from datetime import UTC, datetime
 from typing import Any
 from urllib.parse import urlparse
 
-from src.config import REQUIRED_CORROBORATING_DOMAINS
+from src.config import (
+    FACT_COMPRESSION,
+    FACT_HASH_ALGO,
+    REQUIRED_CORROBORATING_DOMAINS,
+)
+
+# Optional: zstandard decodes fact content faster than zlib; zlib is the fallback.
+try:
+    import zstandard as zstd
+except ImportError:
+    zstd = None  # type: ignore[assignment]
 
 logger = logging.getLogger(__name__)
 
 DEFAULT_DB_PATH = "axiom_ledger.db"
 
+# Short facts gain nothing from zlib (its header alone eats the savings), so
+# they are stored as raw UTF-8 behind a marker byte that a zlib stream can
+# never start with.
+RAW_CONTENT_THRESHOLD = 60
+RAW_CONTENT_MARKER = b"\x00"
+# zstd frames are recognized by their magic number, so zlib, zstd and raw
+# rows can coexist in one ledger.
+ZSTD_FRAME_MAGIC = b"\x28\xb5\x2f\xfd"
+ZSTD_LEVEL = 3
+
+if FACT_COMPRESSION == "zstd" and zstd is None:
+    logger.warning(
+        "[Ledger] AXIOM_FACT_COMPRESSION=zstd but zstandard is not installed; using zlib.",
+    )
+_USE_ZSTD = FACT_COMPRESSION == "zstd" and zstd is not None
+
+# zstd contexts are not safe for concurrent use; keep one pair per thread.
+_zstd_local = threading.local()
+
+
+# Fact ID hashes; both yield 32-byte digests so IDs keep the same shape.
+FACT_HASHES: dict[str, Any] = {
+    "sha256": hashlib.sha256,
+    "blake2b": lambda data: hashlib.blake2b(data, digest_size=32),
+}
+if FACT_HASH_ALGO not in FACT_HASHES:
+    logger.warning(
+        f"[Ledger] Unknown AXIOM_FACT_HASH_ALGO {FACT_HASH_ALGO!r}; using sha256.",
+    )
+    FACT_HASH_ALGO = "sha256"
+elif FACT_HASH_ALGO != "sha256":
+    logger.warning(
+        f"[Ledger] Deriving fact IDs with {FACT_HASH_ALGO}; every node in this network must use the same AXIOM_FACT_HASH_ALGO or identical facts get different IDs.",
+    )
+
+
+def fact_digest(data: bytes, algo: str = FACT_HASH_ALGO) -> bytes:
+    """Return the raw 32-byte fact hash of UTF-8 content."""
+    return FACT_HASHES[algo](data).digest()
+
+
+def make_fact_id(text: str) -> str:
+    """Derive the ID for a new fact with the node's configured hash."""
+    return fact_digest(text.encode("utf-8")).hex()
+
+
+def compress_fact_content(text: str) -> bytes:
+    """Encode fact text for the `fact_content` BLOB column."""
+    return compress_fact_bytes(text.encode("utf-8"))
+
+
+def compress_fact_bytes(encoded: bytes) -> bytes:
+    """Like compress_fact_content, for text the caller already UTF-8 encoded."""
+    if len(encoded) < RAW_CONTENT_THRESHOLD:
+        return RAW_CONTENT_MARKER + encoded
+    if _USE_ZSTD:
+        compressor = getattr(_zstd_local, "compressor", None)
+        if compressor is None:
+            compressor = _zstd_local.compressor = zstd.ZstdCompressor(
+                level=ZSTD_LEVEL
+            )
+        return compressor.compress(encoded)
+    return zlib.compress(encoded)
+
+
+def decompress_fact_content(raw: bytes | bytearray | str | None) -> str:
+    """Decode a `fact_content` value written by compress_fact_content.
+
+    Legacy plaintext rows are returned as-is. Raises zlib.error or
+    ValueError (including UnicodeDecodeError) on corrupt BLOBs.
+    """
+    if raw is None:
+        return ""
+    if isinstance(raw, str):
+        return raw
+    if raw[:1] == RAW_CONTENT_MARKER:
+        return bytes(raw[1:]).decode("utf-8")
+    if raw[:4] == ZSTD_FRAME_MAGIC:
+        return _zstd_decompress(bytes(raw)).decode("utf-8")
+    return zlib.decompress(raw).decode("utf-8")
+
+
+def _zstd_decompress(raw: bytes) -> bytes:
+    if zstd is None:
+        raise ValueError(
+            "zstd-compressed fact found but zstandard is not installed"
+        )
+    decompressor = getattr(_zstd_local, "decompressor", None)
+    if decompressor is None:
+        decompressor = _zstd_local.decompressor = zstd.ZstdDecompressor()
+    try:
+        return decompressor.decompress(raw)
+    except zstd.ZstdError as e:
+        raise ValueError(f"corrupt zstd fact content: {e}") from e
+
+
+# Page cache per ledger connection, in KiB (passed negated to cache_size).
+CONN_CACHE_KIB = 65536
+
+
+def _tune_connection(conn: sqlite3.Connection) -> None:
+    """Apply the per-connection pragmas every ledger connection uses.
+
+    The ledger runs in WAL mode (see initialize_database), where
+    synchronous=NORMAL is still crash-safe and skips an fsync per commit.
+    Temp tables and sort spills stay in memory, and the page cache is
+    large enough to keep the facts indexes hot across a sync.
+    """
+    conn.execute("PRAGMA synchronous=NORMAL")
+    conn.execute("PRAGMA temp_store=MEMORY")
+    conn.execute(f"PRAGMA cache_size=-{CONN_CACHE_KIB}")
+
+
+def open_connection(db_path: str = DEFAULT_DB_PATH) -> sqlite3.Connection:
+    """Open a ledger connection tuned for write-heavy batches."""
+    conn = sqlite3.connect(db_path)
+    _tune_connection(conn)
+    return conn
+
+
+# Idle autocommit connections per ledger path, reused across peer syncs.
+_conn_pool: dict[str, list[sqlite3.Connection]] = {}
+_conn_pool_lock = threading.Lock()
+CONN_POOL_MAX_IDLE = 4
+
+
+def acquire_connection(db_path: str = DEFAULT_DB_PATH) -> sqlite3.Connection:
+    """Take a pooled ledger connection, opening one if none is idle.
 
+    Pooled connections run in autocommit mode (isolation_level=None):
+    callers wrap writes in explicit BEGIN IMMEDIATE / COMMIT, and must hand
+    the connection back with release_connection instead of closing it.
+    """
+    with _conn_pool_lock:
+        idle = _conn_pool.get(db_path)
+        if idle:
+            return idle.pop()
+    conn = sqlite3.connect(
+        db_path, isolation_level=None, check_same_thread=False
+    )
+    _tune_connection(conn)
+    return conn
+
+
+def release_connection(
+    conn: sqlite3.Connection, db_path: str = DEFAULT_DB_PATH
+) -> None:
+    """Return a connection from acquire_connection, rolling back leftovers."""
+    try:
+        if conn.in_transaction:
+            conn.rollback()
+    except sqlite3.Error:
+        conn.close()
+        return
+    with _conn_pool_lock:
+        idle = _conn_pool.setdefault(db_path, [])
+        if len(idle) < CONN_POOL_MAX_IDLE:
+            idle.append(conn)
+            return
+    conn.close()
+
+
+# db_path -> (ledger_version, root). Recomputing the root is a full ID scan,
+# so it only reruns after the fact-ID set changed.
+_ledger_root_cache: dict[str, tuple[int, str]] = {}
+_ledger_root_lock = threading.Lock()
+
+
+def get_ledger_root(conn: sqlite3.Connection, db_path: str) -> tuple[str, int]:
+    """Return (root, cursor) summarizing the set of fact IDs in a ledger.
+
+    The root is the fact count plus the XOR of every fact ID, so ledgers
+    holding the same facts agree whatever order they were stored in.
+    cursor is MAX(rowid), the resume point /get_fact_ids hands out.
+    """
+    # Read the version first: a write landing during the scan below then
+    # leaves the cache entry already stale instead of wrongly current.
+    try:
+        version = conn.execute(
+            "SELECT version FROM ledger_version"
+        ).fetchone()[0]
+    except (sqlite3.Error, TypeError):
+        version = None
+    head = conn.execute(
+        "SELECT COALESCE(MAX(rowid), 0) FROM facts"
+    ).fetchone()[0]
+    with _ledger_root_lock:
+        cached = _ledger_root_cache.get(db_path)
+    if version is not None and cached is not None and cached[0] == version:
+        return cached[1], head
+
+    count = 0
+    acc = 0
+    for (fact_id,) in conn.execute("SELECT fact_id FROM facts"):
+        count += 1
+        try:
+            acc ^= int(fact_id, 16)
+        except (TypeError, ValueError):
+            acc ^= int.from_bytes(
+                hashlib.sha256(str(fact_id).encode("utf-8")).digest(), "big"
+            )
+    root = f"{count}:{acc:064x}"
+    if version is not None:
+        with _ledger_root_lock:
+            _ledger_root_cache[db_path] = (version, root)
+    return root, head
+
+
+# Corroboration re-derives the domain of every recorded source on each
+# check; the same handful of news sites recur, so parses are memoized.
+@functools.lru_cache(maxsize=4096)
 def _domain_from_url(url: str) -> str:
     """Extract the base domain (e.g., 'bbc.com') to prevent gaming the system with multiple links from one site."""
     try:
@@ -28,7 +252,7 @@ def _domain_from_url(url: str) -> str:
 
 def initialize_database(db_path: str = DEFAULT_DB_PATH) -> None:
     """Create the 'facts' table and the 'fact_relationships' table if they don't exist."""
-    conn = sqlite3.connect(db_path)
+    conn = open_connection(db_path)
     cursor = conn.cursor()
     logger.info(
         f"[Ledger] Initializing and verifying database schema at: {db_path}..."
@@ -92,6 +316,40 @@ def initialize_database(db_path: str = DEFAULT_DB_PATH) -> None:
         )
     """)
 
+    # Bumped by the triggers below on every change to the fact-ID set, from
+    # any writer, so get_ledger_root can tell when its cached root is stale.
+    cursor.execute("""
+        CREATE TABLE IF NOT EXISTS ledger_version (
+            id INTEGER PRIMARY KEY CHECK (id = 0),
+            version INTEGER NOT NULL
+        )
+    """)
+    cursor.execute(
+        "INSERT OR IGNORE INTO ledger_version (id, version) VALUES (0, 0)"
+    )
+    for event in ("INSERT", "DELETE", "UPDATE OF fact_id"):
+        name = "facts_version_" + event.split()[0].lower()
+        cursor.execute(
+            f"CREATE TRIGGER IF NOT EXISTS {name} AFTER {event} ON facts"  # noqa: S608
+            " BEGIN UPDATE ledger_version SET version = version + 1; END"
+        )
+
+    # Per-peer resume point for incremental fact-ID sync (see p2p).
+    cursor.execute("""
+        CREATE TABLE IF NOT EXISTS peer_sync_state (
+            peer_url TEXT PRIMARY KEY,
+            fact_cursor INTEGER NOT NULL DEFAULT 0,
+            last_full_sync REAL NOT NULL DEFAULT 0
+        )
+    """)
+
+    # Ledgers created before lexical processing existed lack this column;
+    # add it before the index below needs it.
+    with contextlib.suppress(Exception):
+        cursor.execute(
+            "ALTER TABLE facts ADD COLUMN lexically_processed INTEGER DEFAULT 0"
+        )
+
     cursor.execute(
         "CREATE INDEX IF NOT EXISTS idx_lexicon_word ON lexicon(word)"
     )
@@ -118,13 +376,45 @@ def initialize_database(db_path: str = DEFAULT_DB_PATH) -> None:
         )
     with contextlib.suppress(Exception):
         cursor.execute("ALTER TABLE facts ADD COLUMN fragment_reason TEXT")
+    # Weighted spaCy entities as JSON, filled lazily by the synthesizer.
+    with contextlib.suppress(Exception):
+        cursor.execute("ALTER TABLE facts ADD COLUMN entities_json TEXT")
 
     with contextlib.suppress(Exception):
         cursor.execute(
             "CREATE INDEX IF NOT EXISTS idx_facts_fragment_state ON facts(fragment_state)"
         )
+    # Covers every column compute_health_snapshot aggregates, so the health
+    # snapshot reads the index instead of the fact rows (and their BLOBs).
+    cursor.execute(
+        "CREATE INDEX IF NOT EXISTS idx_facts_status_trust_ts"
+        " ON facts(status, trust_score, ingest_timestamp_utc)"
+    )
+    # Lets the Pathfinder skip articles the ledger already holds facts from.
+    cursor.execute(
+        "CREATE INDEX IF NOT EXISTS idx_facts_source_url ON facts(source_url)"
+    )
+    # Lets view_ledger's newest-first LIMIT listing walk the index backwards
+    # instead of sorting every fact.
+    cursor.execute(
+        "CREATE INDEX IF NOT EXISTS idx_facts_ingest_ts"
+        " ON facts(ingest_timestamp_utc)"
+    )
+    # Partial index matching the housekeeping DELETE in AxiomNode._prune_ledger;
+    # the WHERE clause must stay textually identical for SQLite to use it.
+    cursor.execute(
+        """
+        CREATE INDEX IF NOT EXISTS idx_facts_prune
+        ON facts(status, ingest_timestamp_utc)
+        WHERE (corroborating_sources IS NULL OR corroborating_sources = '')
+        """
+    )
 
     conn.commit()
+    # WAL lets readers proceed while a writer holds the lock; the setting is
+    # persistent, so applying it here covers every later connection.
+    with contextlib.suppress(sqlite3.Error):
+        conn.execute("PRAGMA journal_mode=WAL")
     conn.close()
     logger.info(
         f"\033[92m[Ledger] Database schema initialized/verified for {db_path}.\033[0m"
@@ -140,7 +430,7 @@ def migrate_fact_content_to_compressed(
     or via older P2P paths) to compressed format in-place.
     """
     try:
-        conn = sqlite3.connect(db_path)
+        conn = open_connection(db_path)
         cursor = conn.cursor()
 
         cursor.execute(
@@ -159,7 +449,7 @@ def migrate_fact_content_to_compressed(
             if not text:
                 continue
             try:
-                compressed = zlib.compress(text.encode("utf-8"))
+                compressed = compress_fact_content(text)
             except Exception as e:
                 logger.warning(
                     f"[Ledger] Could not compress legacy fact {fact_id[:8]} in {db_path}: {e}"
@@ -187,7 +477,7 @@ def get_all_facts_for_analysis(
     db_path: str = DEFAULT_DB_PATH,
 ) -> list[dict[str, Any]]:
     """Fetch facts from the ledger."""
-    conn = sqlite3.connect(db_path)
+    conn = open_connection(db_path)
     conn.row_factory = sqlite3.Row
     cursor = conn.cursor()
     try:
@@ -200,6 +490,25 @@ def get_all_facts_for_analysis(
         conn.close()
 
 
+def iter_facts_for_analysis(
+    db_path: str = DEFAULT_DB_PATH,
+) -> Iterator[tuple[str, Any, str | None]]:
+    """Stream (fact_id, fact_content, entities_json) rows from the ledger.
+
+    Rows are read lazily so callers never hold the whole ledger; decode
+    fact_content with decompress_fact_content only when it is needed.
+    """
+    conn = open_connection(db_path)
+    try:
+        yield from conn.execute(
+            "SELECT fact_id, fact_content, entities_json FROM facts"
+        )
+    except sqlite3.Error as e:
+        logger.error(f"[Ledger] Read Error: {e}")
+    finally:
+        conn.close()
+
+
 def insert_uncorroborated_fact(
     fact_id: Any,
     fact_content: str,
@@ -211,10 +520,10 @@ def insert_uncorroborated_fact(
     db_path: str = DEFAULT_DB_PATH,
 ) -> dict[str, Any] | None:
     """Insert and update facts status as uncorroborated facts."""
-    conn = sqlite3.connect(db_path)
+    conn = open_connection(db_path)
     cursor = conn.cursor()
     timestamp = datetime.now(UTC).isoformat()
-    compressed_content = zlib.compress(fact_content.encode("utf-8"))
+    compressed_content = compress_fact_content(fact_content)
     try:
         cursor.execute(
             """
@@ -268,14 +577,9 @@ def find_similar_fact_from_different_domain(
         existing_domain = _domain_from_url(fact["source_url"])
         if source_domain == existing_domain:
             continue
-        raw = fact["fact_content"]
         try:
-            existing_text = (
-                zlib.decompress(raw).decode("utf-8")
-                if isinstance(raw, bytes)
-                else raw
-            )
-        except (zlib.error, AttributeError):
+            existing_text = decompress_fact_content(fact["fact_content"])
+        except (zlib.error, ValueError):
             continue
         if existing_text.lower().startswith(content_start):
             return fact
@@ -286,7 +590,7 @@ def update_fact_corroboration(
     fact_id: int, new_source_url: str, db_path: str = DEFAULT_DB_PATH
 ) -> None:
     """Update fact status for corroborating_sources."""
-    conn = sqlite3.connect(db_path)
+    conn = open_connection(db_path)
     cursor = conn.cursor()
     try:
         cursor.execute(
@@ -333,7 +637,7 @@ def mark_facts_as_disputed(
     db_path: str = DEFAULT_DB_PATH,
 ) -> None:
     """Dispute facts when they occur and update the status."""
-    conn = sqlite3.connect(db_path)
+    conn = open_connection(db_path)
     cursor = conn.cursor()
     timestamp = datetime.now(UTC).isoformat()
     try:
@@ -365,6 +669,57 @@ def mark_facts_as_disputed(
         conn.close()
 
 
+# Stays under SQLite's default bound-parameter limit.
+SOURCE_URL_PROBE_CHUNK = 900
+
+
+def known_source_urls(
+    urls: list[str],
+    db_path: str = DEFAULT_DB_PATH,
+) -> set[str]:
+    """Return the subset of `urls` some fact in the ledger was taken from."""
+    known: set[str] = set()
+    if not urls:
+        return known
+    conn = open_connection(db_path)
+    try:
+        for start in range(0, len(urls), SOURCE_URL_PROBE_CHUNK):
+            chunk = urls[start : start + SOURCE_URL_PROBE_CHUNK]
+            placeholders = ",".join("?" * len(chunk))
+            known.update(
+                row[0]
+                for row in conn.execute(
+                    f"SELECT DISTINCT source_url FROM facts WHERE source_url IN ({placeholders})",  # noqa: S608
+                    chunk,
+                )
+            )
+    except sqlite3.Error as e:
+        logger.warning(f"[Ledger] Could not look up source URLs: {e}")
+    finally:
+        conn.close()
+    return known
+
+
+def store_fact_entities(
+    entities_by_id: dict[str, str],
+    db_path: str = DEFAULT_DB_PATH,
+) -> None:
+    """Persist precomputed entity JSON so later syncs skip re-parsing."""
+    if not entities_by_id:
+        return
+    conn = open_connection(db_path)
+    try:
+        conn.executemany(
+            "UPDATE facts SET entities_json = ? WHERE fact_id = ?",
+            [(blob, fid) for fid, blob in entities_by_id.items()],
+        )
+        conn.commit()
+    except sqlite3.Error as e:
+        logger.warning(f"[Ledger] Could not store fact entities: {e}")
+    finally:
+        conn.close()
+
+
 def insert_relationship(
     fact_id_1: int,
     fact_id_2: int,
@@ -372,7 +727,7 @@ def insert_relationship(
     db_path: str = DEFAULT_DB_PATH,
 ) -> None:
     """Create relationships between facts."""
-    conn = sqlite3.connect(db_path)
+    conn = open_connection(db_path)
     cursor = conn.cursor()
     id1, id2 = (
         (fact_id_1, fact_id_2)
@@ -389,11 +744,55 @@ def insert_relationship(
         conn.close()
 
 
+def insert_fact_links(
+    relationships: list[tuple[str, str, float]],
+    synapse_pairs: list[tuple[str, str]],
+    relation: str,
+    db_path: str = DEFAULT_DB_PATH,
+) -> None:
+    """Store a batch of fact relationships and synapse bumps in one transaction.
+
+    Same normalization as insert_relationship and update_synapse, with one
+    executemany per table instead of a connection and commit per row.
+    """
+    if not relationships and not synapse_pairs:
+        return
+    conn = open_connection(db_path)
+    try:
+        conn.execute("BEGIN IMMEDIATE")
+        conn.executemany(
+            "INSERT OR IGNORE INTO fact_relationships (fact_id_1, fact_id_2, weight) VALUES (?, ?, ?)",
+            [
+                (id1, id2, weight) if id1 < id2 else (id2, id1, weight)
+                for id1, id2, weight in relationships
+            ],
+        )
+        conn.executemany(
+            """
+            INSERT INTO synapses (word_a, word_b, relation_type, strength)
+            VALUES (?, ?, ?, 1)
+            ON CONFLICT(word_a, word_b, relation_type) DO UPDATE SET strength = strength + 1
+            """,
+            [
+                (w1.lower(), w2.lower(), relation)
+                if w1 < w2
+                else (w2.lower(), w1.lower(), relation)
+                for w1, w2 in synapse_pairs
+            ],
+        )
+        conn.commit()
+    except sqlite3.Error:
+        conn.rollback()
+        raise
+    finally:
+        conn.close()
+
+
 def get_unprocessed_facts_for_lexicon(
     db_path: str = DEFAULT_DB_PATH,
 ) -> list[dict[str, Any]]:
     """Fetch facts that the brain hasn't learned from yet."""
-    conn = sqlite3.connect(db_path)
+    conn = open_connection(db_path)
     conn.row_factory = sqlite3.Row
     cursor = conn.cursor()
     cursor.execute(
@@ -408,7 +807,7 @@ def mark_fact_as_processed(
     fact_id: int, db_path: str = DEFAULT_DB_PATH
 ) -> None:
     """Update Fact status as processed."""
-    conn = sqlite3.connect(db_path)
+    conn = open_connection(db_path)
     cursor = conn.cursor()
     cursor.execute(
         "UPDATE facts SET lexically_processed = 1 WHERE fact_id = ?",
@@ -422,7 +821,7 @@ def update_lexical_atom(
     word: str, pos: str, db_path: str = DEFAULT_DB_PATH
 ) -> None:
     """Update the lexical values."""
-    conn = sqlite3.connect(db_path)
+    conn = open_connection(db_path)
     cursor = conn.cursor()
     cursor.execute(
         """
@@ -440,7 +839,7 @@ def update_synapse(
     word_a: str, word_b: str, relation: str, db_path: str = DEFAULT_DB_PATH
 ) -> None:
     """Update synapses values."""
-    conn = sqlite3.connect(db_path)
+    conn = open_connection(db_path)
     cursor = conn.cursor()
     w1, w2 = (word_a, word_b) if word_a < word_b else (word_b, word_a)
     cursor.execute(
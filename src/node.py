@@ -2,6 +2,9 @@
 
 from __future__ import annotations
 
+import contextlib
+import gzip
+import heapq
 import logging
 import math
 import os
@@ -10,12 +13,22 @@ import sqlite3
 import threading
 import time
 import zlib
-from concurrent.futures import ThreadPoolExecutor
+from concurrent.futures import (
+    ThreadPoolExecutor,
+    TimeoutError as FuturesTimeoutError,
+    as_completed,
+)
 from datetime import UTC, datetime, timedelta
 from typing import TYPE_CHECKING, Any
 
-import requests
-from flask import Flask, Response, jsonify, request, send_from_directory
+from flask import (
+    Flask,
+    Response,
+    jsonify,
+    request,
+    send_from_directory,
+    stream_with_context,
+)
 from flask_cors import CORS
 
 # --- IMPORT AXIOM MODULES ---
@@ -27,13 +40,20 @@ from src import (
     universal_extractor,
     zeitgeist_engine,
 )
-from src.api_query import query_lexical_mesh, search_ledger_for_api
+from src.api_query import (
+    get_facts_by_ids,
+    query_lexical_mesh,
+    search_ledger_for_api,
+)
 from src.axiom_logger import setup_logger
 from src.blockchain import create_block, get_blocks_after, get_chain_head
 from src.code_introspector import build_endpoint_registry, build_module_map
 from src.conversation_patterns import (
     compile_patterns,
+    load_compiled_patterns,
     match_query,
+    pattern_cache_path,
+    save_compiled_patterns,
     seed_patterns,
 )
 from src.data_quality import (
@@ -41,17 +61,30 @@ from src.data_quality import (
     find_duplicate_candidates,
 )
 from src.ledger import (
+    FACT_HASH_ALGO,
+    acquire_connection,
+    decompress_fact_content,
+    get_ledger_root,
     get_unprocessed_facts_for_lexicon,
     initialize_database,
     mark_fact_as_processed,
     migrate_fact_content_to_compressed,
+    open_connection,
+    release_connection,
+)
+from src.p2p import (
+    HASH_ALGO_HEADER,
+    build_peer_session,
+    dumps_json,
+    loads_json,
+    sync_chain_with_peer,
+    sync_with_peer,
 )
-from src.p2p import sync_chain_with_peer, sync_with_peer
 from src.self_check import run_self_checks
 from src.system_health import compute_health_snapshot
 
 if TYPE_CHECKING:
-    from collections.abc import Callable
+    from collections.abc import Callable, Iterator
 
 
 setup_logger()
@@ -60,6 +93,52 @@ logger = logging.getLogger("node")
 app = Flask(__name__)
 CORS(app, supports_credentials=True, resources={r"/*": {"origins": "*"}})
 
+# Fact IDs fetched and encoded per chunk of the streamed /get_fact_ids body.
+FACT_ID_STREAM_BATCH = 5000
+
+# JSON bodies below this size are sent as-is; gzip framing would not pay off.
+GZIP_MIN_BYTES = 1024
+
+
+@app.after_request
+def _gzip_json_response(response: Response) -> Response:
+    """Gzip JSON bodies for clients that accept it (requests does by default).
+
+    Peer-sync payloads are highly repetitive JSON, so level 1 already cuts
+    them several-fold at little CPU cost. Streamed and file responses are
+    left untouched.
+    """
+    if (
+        response.direct_passthrough
+        or response.is_streamed
+        or response.status_code < 200
+        or response.status_code >= 300
+        or response.mimetype != "application/json"
+        or "Content-Encoding" in response.headers
+        or not _accepts_gzip()
+    ):
+        return response
+    body = response.get_data()
+    if len(body) < GZIP_MIN_BYTES:
+        return response
+    response.set_data(gzip.compress(body, compresslevel=1))
+    response.headers["Content-Encoding"] = "gzip"
+    response.vary.add("Accept-Encoding")
+    return response
+
+
+def _accepts_gzip() -> bool:
+    return "gzip" in request.headers.get("Accept-Encoding", "").lower()
+
+
+def _gzip_stream(chunks: Iterator[bytes]) -> Iterator[bytes]:
+    """Gzip a streamed body on the fly, for the responses the hook above skips."""
+    compressor = zlib.compressobj(1, zlib.DEFLATED, 16 + zlib.MAX_WBITS)
+    for chunk in chunks:
+        if compressed := compressor.compress(chunk):
+            yield compressed
+    yield compressor.flush()
+
 
 def print_banner() -> None:
     """Print the banner for Axiom - Engine."""
@@ -81,6 +160,30 @@ def print_banner() -> None:
     print(r)
 
 
+# Substrings of module names highlighted by the /think system-map summary.
+_KEY_MODULE_HINTS = ("node.py", "crucible", "synthesizer", "blockchain", "p2p")
+
+# Leading words that suggest a sentence was cut from surrounding context.
+_PRONOUN_STARTS = frozenset(
+    {"he", "she", "they", "it", "this", "that", "these", "those"}
+)
+
+# (monotonic stamp, ISO string); swapped as one tuple so readers on other
+# threads never see a stamp paired with the wrong string.
+_iso_cache: tuple[float, str] = (float("-inf"), "")
+
+
+def _iso_now() -> str:
+    """Return the current UTC time as ISO-8601, refreshed at most once per second."""
+    global _iso_cache
+    now = time.monotonic()
+    stamp, iso = _iso_cache
+    if now - stamp >= 1.0:
+        iso = datetime.now(UTC).isoformat()
+        _iso_cache = (now, iso)
+    return iso
+
+
 def _normalize_bootstrap_peer(raw_value: Any, self_port: int) -> str | None:
     if not raw_value or not str(raw_value).strip():
         return None
@@ -137,6 +240,13 @@ class AxiomNode:
         self.investigation_queue: list[Any] = []
         self.active_proposals: dict[Any, Any] = {}
         self.thread_pool = ThreadPoolExecutor(max_workers=10)
+        self._stop = threading.Event()
+        # Keep-alive session shared by every outbound peer call so repeated
+        # polls and syncs reuse sockets instead of reconnecting each time.
+        self.http = build_peer_session()
+        # No retries: the fragment-opinion poll must answer within its
+        # as_completed deadline.
+        self.http_no_retry = build_peer_session(pool_maxsize=8, retries=0)
 
         # Scheduler configuration for main cycles and idle ticks.
         self.main_cycle_interval: int = int(
@@ -150,9 +260,13 @@ class AxiomNode:
             os.environ.get("AXIOM_IDLE_SUITE_INTERVAL", "150.0")
         )
 
-        # Idle task registry state.
+        # Idle task registry state. The schedule is a min-heap of
+        # (next_run_monotonic, seq, interval, task) so each tick only peeks
+        # at the head instead of asking every task whether it is due.
         self.idle_tasks: list[Callable[[], None]] = []
-        self._idle_task_index: int = 0
+        self._idle_schedule: list[
+            tuple[float, int, float, Callable[[], None]]
+        ] = []
         self._last_idle_learning_ts: float = 0.0
 
         # Conversation subsystem (populated during idle training).
@@ -161,6 +275,10 @@ class AxiomNode:
         # Code introspection and health snapshots.
         self._code_map: dict[str, Any] | None = None
         self._endpoint_registry: list[dict[str, Any]] = []
+        # Bumped on every introspection refresh; keys the /think summary caches.
+        self._code_map_version: int = 0
+        self._system_map_summary_cache: tuple[int, str] | None = None
+        self._endpoints_summary_cache: tuple[int, str] | None = None
         self._last_code_introspection_ts: float = 0.0
         self._duplicate_summary: list[Any] = []
         self._conflict_summary: list[Any] = []
@@ -171,7 +289,6 @@ class AxiomNode:
         self._last_self_check_ts: float = 0.0
         self._last_main_cycle_ts: float = 0.0
         self._last_fragment_audit_ts: float = 0.0
-        self._idle_throttle_log: dict[str, float] = {}
         self._idle_suite_header_active: bool = False
         self.node_role: str = "bootstrap" if port == 8009 else "peer"
 
@@ -186,18 +303,29 @@ class AxiomNode:
             self.db_path = os.environ.get("AXIOM_DB_PATH", default_db_name)
 
         initialize_database(self.db_path)
+        self._thread_conns = threading.local()
         # Optional self-healing migration to keep fact storage consistent.
         migrate_fact_content_to_compressed(self.db_path)
         self.search_ledger_for_api: Callable[..., Any] = search_ledger_for_api
 
-        # Register built-in idle tasks.
-        self.idle_tasks.append(self._idle_learning_cycle)
-        self.idle_tasks.append(self._idle_conversation_training)
-        self.idle_tasks.append(self._idle_code_introspection)
-        self.idle_tasks.append(self._idle_data_quality)
-        self.idle_tasks.append(self._idle_fragment_audit)
-        self.idle_tasks.append(self._idle_health_snapshot)
-        self.idle_tasks.append(self._idle_self_checks)
+        # Warm start: reuse regexes persisted beside this ledger by a
+        # previous run, if any.
+        self._pattern_cache_path = pattern_cache_path(self.db_path)
+        cached_patterns = seed_patterns()
+        if load_compiled_patterns(cached_patterns, self._pattern_cache_path):
+            self._conversation_patterns = cached_patterns
+            self._conversation_training_state = {
+                "compiled_index": len(cached_patterns)
+            }
+
+        # Register built-in idle tasks with their minimum spacing in seconds.
+        self.register_idle_task(self._idle_learning_cycle, 300.0)
+        self.register_idle_task(self._idle_conversation_training, 0.0)
+        self.register_idle_task(self._idle_code_introspection, 3600.0)
+        self.register_idle_task(self._idle_data_quality, 900.0)
+        self.register_idle_task(self._idle_fragment_audit, 300.0)
+        self.register_idle_task(self._idle_health_snapshot, 600.0)
+        self.register_idle_task(self._idle_self_checks, 10800.0)
 
     def bootstrap_sync(self) -> bool | None:
         """Perform initial sync with bootstrap peers."""
@@ -286,17 +414,16 @@ class AxiomNode:
             peer_url = "http://127.0.0.1:8009"
 
         if peer_url in self.peers:
-            self.peers[peer_url]["last_seen"] = datetime.now(
-                UTC,
-            ).isoformat()
+            self.peers[peer_url]["last_seen"] = _iso_now()
             return
 
         from src.config import PEER_REP_INITIAL
 
+        seen = _iso_now()
         self.peers[peer_url] = {
             "reputation": PEER_REP_INITIAL,
-            "first_seen": datetime.now(UTC).isoformat(),
-            "last_seen": datetime.now(UTC).isoformat(),
+            "first_seen": seen,
+            "last_seen": seen,
         }
         logger.info(f"\033[92m[Mesh] New node identified: {peer_url}\033[0m")
 
@@ -348,7 +475,7 @@ class AxiomNode:
     def _fetch_from_peer(self, peer_url: str, search_term: str) -> list[Any]:
         try:
             query_url = f"{peer_url}/local_query?term={search_term}&include_uncorroborated=true"
-            response = requests.get(query_url, timeout=5)
+            response = self.http.get(query_url, timeout=5)
             response.raise_for_status()
 
             # Parse the JSON (Mypy sees this as 'Any')
@@ -383,16 +510,10 @@ class AxiomNode:
         for fact in unprocessed_facts:
             try:
                 raw = fact.get("fact_content")
-                text = ""
-                if isinstance(raw, (bytes, bytearray)):
-                    try:
-                        text = zlib.decompress(raw).decode("utf-8")
-                    except (zlib.error, ValueError):
-                        continue
-                elif isinstance(raw, str):
-                    text = raw
-                else:
-                    text = str(raw) if raw is not None else ""
+                try:
+                    text = decompress_fact_content(raw)
+                except (zlib.error, ValueError):
+                    continue
 
                 if text and crucible.integrate_fact_to_mesh(text):
                     mark_fact_as_processed(fact["fact_id"], self.db_path)
@@ -402,48 +523,61 @@ class AxiomNode:
             "Success: Neural pathways strengthened. Idle cycle complete.",
         )
 
+    def get_conn(self) -> sqlite3.Connection:
+        """Return this thread's long-lived ledger connection, opening it lazily.
+
+        Meant for the background loop, whose thread lives as long as the
+        node; request handlers run on short-lived threads and borrow from
+        the ledger pool through _request_conn instead. Callers must not
+        close it.
+        """
+        conn: sqlite3.Connection | None = getattr(
+            self._thread_conns, "conn", None
+        )
+        if conn is None:
+            conn = sqlite3.connect(self.db_path)
+            conn.execute("PRAGMA cache_size=-20000")
+            conn.execute("PRAGMA temp_store=MEMORY")
+            self._thread_conns.conn = conn
+        return conn
+
     def _idle_learning_cycle(self) -> None:
         """Productive tasks between main cycles: rediscover links, reinforce synapses."""
         try:
-            # Throttle heavy idle learning so it does not run on every tick.
-            now = time.time()
-            interval = 300.0
-            if now - self._last_idle_learning_ts < interval:
-                self._maybe_log_idle_throttle(
-                    "learning",
-                    interval,
-                    now,
-                    self._last_idle_learning_ts,
-                )
-                return
-
             self._ensure_idle_suite_header()
 
-            conn = sqlite3.connect(self.db_path)
-            conn.row_factory = sqlite3.Row
-            cur = conn.cursor()
+            # One round trip for both the rediscovery sample and the
+            # high-trust reinforcement sample, tagged by bucket.
+            cur = self.get_conn().cursor()
             cur.execute(
-                "SELECT fact_id, fact_content, trust_score, status FROM facts WHERE status != 'disputed' ORDER BY RANDOM() LIMIT 30"
+                """
+                SELECT * FROM (
+                    SELECT fact_id, fact_content, 'learn' FROM facts
+                    WHERE status != 'disputed'
+                    ORDER BY RANDOM() LIMIT 30
+                )
+                UNION ALL
+                SELECT * FROM (
+                    SELECT fact_id, fact_content, 'reinforce' FROM facts
+                    WHERE status != 'disputed'
+                    AND (trust_score >= 2 OR status = 'trusted')
+                    ORDER BY RANDOM() LIMIT 5
+                )
+                """
             )
             rows = cur.fetchall()
-            conn.close()
-            if not rows:
+            learn_rows = [(f, c) for f, c, b in rows if b == "learn"]
+            reinforce_rows = [(f, c) for f, c, b in rows if b == "reinforce"]
+            if not learn_rows:
                 return
             sample = []
-            for row in rows:
-                raw = row["fact_content"]
+            for fact_id, raw in learn_rows:
                 try:
-                    text = (
-                        zlib.decompress(raw).decode("utf-8")
-                        if isinstance(raw, (bytes, bytearray))
-                        else (raw or "")
-                    )
+                    text = decompress_fact_content(raw)
                 except (zlib.error, ValueError, TypeError):
                     continue
                 if text:
-                    sample.append(
-                        {"fact_id": row["fact_id"], "fact_content": text}
-                    )
+                    sample.append({"fact_id": fact_id, "fact_content": text})
             if sample:
                 logger.info(
                     "\033[2m[Idle:%s] Relationship rediscovery: re-linking %d facts against full ledger...\033[0m",
@@ -452,24 +586,16 @@ class AxiomNode:
                 )
                 synthesizer.link_related_facts(sample, db_path=self.db_path)
             # Reinforce synapses: re-integrate a few high-trust facts into the mesh
-            conn = sqlite3.connect(self.db_path)
-            cur = conn.cursor()
-            cur.execute(
-                "SELECT fact_id, fact_content FROM facts WHERE status != 'disputed' AND (trust_score >= 2 OR status = 'trusted') ORDER BY RANDOM() LIMIT 5"
-            )
-            reinforce_rows = cur.fetchall()
-            conn.close()
             reinforced = 0
-            for row in reinforce_rows:
-                raw = row[1]
-                try:
-                    text = (
-                        zlib.decompress(raw).decode("utf-8")
-                        if isinstance(raw, (bytes, bytearray))
-                        else (raw or "")
-                    )
-                except (zlib.error, ValueError, TypeError):
-                    continue
+            # High-trust facts often land in both samples; reuse their text.
+            sample_by_id = {s["fact_id"]: s["fact_content"] for s in sample}
+            for fact_id, raw in reinforce_rows:
+                text = sample_by_id.get(fact_id)
+                if text is None:
+                    try:
+                        text = decompress_fact_content(raw)
+                    except (zlib.error, ValueError, TypeError):
+                        continue
                 if text and crucible.integrate_fact_to_mesh(text):
                     reinforced += 1
             if reinforced:
@@ -479,7 +605,7 @@ class AxiomNode:
                     reinforced,
                 )
             # Only mark as run if we reached the end without early return.
-            self._last_idle_learning_ts = now
+            self._last_idle_learning_ts = time.time()
         except Exception as e:
             logger.info("[Idle:%s] Learning cycle skipped: %s", self.port, e)
 
@@ -499,6 +625,7 @@ class AxiomNode:
                 content_list = universal_extractor.find_and_extract(
                     topic,
                     max_sources=3,
+                    db_path=self.db_path,
                 )
                 for item in content_list:
                     new_facts = crucible.extract_facts_from_text(
@@ -586,6 +713,9 @@ class AxiomNode:
 
         # Log occasionally when we make progress.
         if upper == len(self._conversation_patterns):
+            save_compiled_patterns(
+                self._conversation_patterns, self._pattern_cache_path
+            )
             self._ensure_idle_suite_header()
             logger.info(
                 "[Idle-Conv:%s] Conversation patterns ready: %d",
@@ -596,20 +726,8 @@ class AxiomNode:
     def _idle_code_introspection(self) -> None:
         """Periodically refresh an internal map of modules and HTTP endpoints.
 
-        This is throttled to avoid unnecessary filesystem work.
+        This is scheduled at most once per hour to avoid unnecessary filesystem work.
         """
-        now = time.time()
-        # Run at most once per hour.
-        interval = 3600.0
-        if now - self._last_code_introspection_ts < interval:
-            self._maybe_log_idle_throttle(
-                "code",
-                interval,
-                now,
-                self._last_code_introspection_ts,
-            )
-            return
-
         self._ensure_idle_suite_header()
 
         src_root = os.path.dirname(os.path.abspath(__file__))
@@ -617,7 +735,8 @@ class AxiomNode:
             self._code_map = build_module_map(src_root)
             node_path = os.path.join(src_root, "node.py")
             self._endpoint_registry = build_endpoint_registry(node_path)
-            self._last_code_introspection_ts = now
+            self._code_map_version += 1
+            self._last_code_introspection_ts = time.time()
             logger.info(
                 "[Idle-Code:%s] Refreshed code map (%d modules, %d endpoints).",
                 self.port,
@@ -634,18 +753,6 @@ class AxiomNode:
 
         Results are cached in-memory for later inspection or reporting.
         """
-        now = time.time()
-        # Run at most once every 15 minutes.
-        interval = 900.0
-        if now - self._last_data_quality_ts < interval:
-            self._maybe_log_idle_throttle(
-                "data",
-                interval,
-                now,
-                self._last_data_quality_ts,
-            )
-            return
-
         self._ensure_idle_suite_header()
 
         try:
@@ -653,7 +760,7 @@ class AxiomNode:
             conflicts = find_conflict_candidates(self.db_path, sample_size=300)
             self._duplicate_summary = dupes
             self._conflict_summary = conflicts
-            self._last_data_quality_ts = now
+            self._last_data_quality_ts = time.time()
             logger.info(
                 "[Idle-Data:%s] Sampled data quality: %d duplicate groups, %d conflict groups.",
                 self.port,
@@ -667,23 +774,11 @@ class AxiomNode:
 
     def _idle_health_snapshot(self) -> None:
         """Periodically compute a lightweight health snapshot of the ledger/db."""
-        now = time.time()
-        # Run at most once every 10 minutes.
-        interval = 600.0
-        if now - self._last_health_snapshot_ts < interval:
-            self._maybe_log_idle_throttle(
-                "health",
-                interval,
-                now,
-                self._last_health_snapshot_ts,
-            )
-            return
-
         self._ensure_idle_suite_header()
 
         try:
             self._health_snapshot = compute_health_snapshot(self.db_path)
-            self._last_health_snapshot_ts = now
+            self._last_health_snapshot_ts = time.time()
             logger.info(
                 "[Idle-Health:%s] Updated health snapshot: %s",
                 self.port,
@@ -714,25 +809,15 @@ class AxiomNode:
 
     def _idle_self_checks(self) -> None:
         """Occasionally run a few deterministic self-queries against our own /think endpoint."""
-        now = time.time()
-        # Run at most once every 3 hours.
-        interval = 10800.0
-        if now - self._last_self_check_ts < interval:
-            self._maybe_log_idle_throttle(
-                "selfcheck",
-                interval,
-                now,
-                self._last_self_check_ts,
-            )
-            return
-
         self._ensure_idle_suite_header()
 
         # Use the local self_url to avoid any external DNS/network dependency.
         base_url = self.self_url
         try:
-            self._self_check_results = run_self_checks(base_url)
-            self._last_self_check_ts = now
+            self._self_check_results = run_self_checks(
+                base_url, session=self.http
+            )
+            self._last_self_check_ts = time.time()
             logger.info(
                 "[Idle-SelfCheck:%s] Completed self-checks: %s",
                 self.port,
@@ -748,30 +833,17 @@ class AxiomNode:
 
         from peers about low-quality fragments.
         """
-        now = time.time()
-        interval = 300.0  # 5 minutes between audits per node
-        if now - self._last_fragment_audit_ts < interval:
-            self._maybe_log_idle_throttle(
-                "fragment_audit",
-                interval,
-                now,
-                self._last_fragment_audit_ts,
-            )
-            return
-
         self._ensure_idle_suite_header()
 
-        import sqlite3 as _sqlite3
-
         try:
-            conn = _sqlite3.connect(self.db_path)
-            conn.row_factory = _sqlite3.Row
+            conn = open_connection(self.db_path)
             cur = conn.cursor()
 
             # Sample a bounded number of candidate facts.
             cur.execute(
                 """
-                SELECT fact_id, fact_content, fragment_state, fragment_score, status
+                SELECT fact_id, fact_content, fragment_state, fragment_score,
+                       fragment_reason, status
                 FROM facts
                 WHERE status != 'disputed'
                 ORDER BY RANDOM()
@@ -781,26 +853,23 @@ class AxiomNode:
             rows = cur.fetchall()
             if not rows:
                 conn.close()
-                self._last_fragment_audit_ts = now
+                self._last_fragment_audit_ts = time.time()
                 return
 
-            import zlib as _zlib
+            updates: list[tuple[str, str, float, str | None]] = []
+            for (
+                fact_id,
+                raw,
+                fragment_state,
+                fragment_score,
+                fragment_reason,
+                _status,
+            ) in rows:
+                fragment_state = fragment_state or "unknown"
+                fragment_score = float(fragment_score or 0.0)
 
-            updated = 0
-            for row in rows:
-                fact_id = row["fact_id"]
-                fragment_state = row["fragment_state"] or "unknown"
-                fragment_score = float(row["fragment_score"] or 0.0)
-
-                raw = row["fact_content"]
                 try:
-                    text = ""
-                    if isinstance(raw, (bytes, bytearray)):
-                        text = _zlib.decompress(raw).decode("utf-8")
-                    elif isinstance(raw, str):
-                        text = raw
-                    else:
-                        text = str(raw) if raw is not None else ""
+                    text = decompress_fact_content(raw)
                 except Exception as e:
                     logger.error(f"Error processing fact content: {e}")
                     continue
@@ -811,7 +880,6 @@ class AxiomNode:
 
                 words = text.split()
                 word_count = len(words)
-                lower = text.lower()
 
                 # Simple, model-free heuristic refinement.
                 score = 0.0
@@ -823,17 +891,7 @@ class AxiomNode:
                     score += 0.3
                     reasons.append("moderately_short")
 
-                pronoun_starts = (
-                    "he ",
-                    "she ",
-                    "they ",
-                    "it ",
-                    "this ",
-                    "that ",
-                    "these ",
-                    "those ",
-                )
-                if any(lower.startswith(p) for p in pronoun_starts):
+                if word_count > 1 and words[0].lower() in _PRONOUN_STARTS:
                     score += 0.25
                     reasons.append("pronoun_start")
 
@@ -863,115 +921,182 @@ class AxiomNode:
                 if new_state == "suspected_fragment" and self.peers:
                     positives = 0
                     negatives = 0
-                    headers = {"X-Axiom-Peer": self.advertised_url}
-                    for peer_url in list(self.peers.keys())[:3]:
-                        try:
-                            resp = requests.get(
-                                f"{peer_url}/fragment_opinion",
-                                params={"fact_id": fact_id},
-                                timeout=3,
-                                headers=headers,
-                            )
-                            if resp.status_code != 200:
-                                continue
-                            data = resp.json()
-                            if not data.get("seen"):
-                                positives += 1
-                                continue
-                            peer_state = (
-                                data.get("fragment_state") or "unknown"
-                            )
-                            peer_status = data.get("status")
-                            peer_trust = float(
-                                data.get("trust_score", 0.0) or 0.0
-                            )
-                            if peer_state in (
-                                "suspected_fragment",
-                                "confirmed_fragment",
-                            ):
+                    # Poll peers concurrently; the audit waits on the slowest
+                    # reply rather than the sum of every timeout.
+                    futures = [
+                        self.thread_pool.submit(
+                            self._fetch_peer_opinion, peer_url, fact_id
+                        )
+                        for peer_url in list(self.peers.keys())[:3]
+                    ]
+                    try:
+                        for future in as_completed(futures, timeout=5):
+                            opinion = future.result()
+                            if opinion == "pos":
                                 positives += 1
-                            elif peer_state == "rejected_fragment" or (
-                                peer_status == "trusted" and peer_trust >= 2
-                            ):
+                            elif opinion == "neg":
                                 negatives += 1
-                        except Exception as e:
-                            logger.error(f"Error processing fact content: {e}")
-                            continue
+                            if positives and negatives:
+                                # Split vote: neither rule below can fire, so
+                                # drop polls that have not started yet.
+                                for pending in futures:
+                                    pending.cancel()
+                                break
+                    except FuturesTimeoutError:
+                        logger.debug(
+                            "[Idle-Fragment:%s] Peer opinion poll timed out for %s.",
+                            self.port,
+                            fact_id[:8],
+                        )
 
                     if positives > 0 and negatives == 0:
                         new_state = "confirmed_fragment"
                     elif negatives > 0 and positives == 0:
                         new_state = "rejected_fragment"
 
+                # Different reason sets can score within 0.05 of each other,
+                # so the reasons are compared too; they are stored sorted.
+                new_reason = ",".join(sorted(reasons)) if reasons else None
+                old_reason = (
+                    ",".join(sorted(fragment_reason.split(",")))
+                    if fragment_reason
+                    else None
+                )
                 if (
                     new_state != fragment_state
                     or abs(score - fragment_score) > 0.05
+                    or new_reason != old_reason
                 ):
-                    cur.execute(
-                        """
-                        UPDATE facts
-                        SET fragment_state = ?, fragment_score = ?, fragment_reason = ?
-                        WHERE fact_id = ?
-                        """,
-                        (
-                            new_state,
-                            score,
-                            ",".join(reasons) if reasons else None,
-                            fact_id,
-                        ),
-                    )
-                    updated += 1
+                    updates.append((fact_id, new_state, score, new_reason))
 
-            if updated:
-                conn.commit()
+            if updates:
+                # Take the write lock only now, after the peer polls, so the
+                # audit never holds it across network waits.
+                cur.execute("BEGIN IMMEDIATE")
+                try:
+                    self._apply_fragment_updates(cur, updates)
+                    conn.commit()
+                except Exception:
+                    conn.rollback()
+                    conn.close()
+                    raise
                 logger.info(
                     "[Idle-Fragment:%s] Audited %d fact(s); updated classifications for %d.",
                     self.port,
                     len(rows),
-                    updated,
+                    len(updates),
                 )
 
             conn.close()
-            self._last_fragment_audit_ts = now
+            self._last_fragment_audit_ts = time.time()
         except Exception as e:
             logger.info(
                 "[Idle-Fragment:%s] Fragment audit skipped: %s", self.port, e
             )
 
+    def _fetch_peer_opinion(self, peer_url: str, fact_id: str) -> str | None:
+        """Ask one peer about a fact: "pos" if it looks like a fragment there,
+
+        "neg" if the peer vouches for it, None when the peer has no useful answer.
+        """
+        try:
+            resp = self.http_no_retry.get(
+                f"{peer_url}/fragment_opinion",
+                params={"fact_id": fact_id},
+                timeout=3,
+                headers={"X-Axiom-Peer": self.advertised_url},
+            )
+            if resp.status_code != 200 or not resp.content:
+                return None
+            data = loads_json(resp.content)
+            if not isinstance(data, dict):
+                return None
+            if not data.get("seen"):
+                return "pos"
+            peer_state = data.get("fragment_state") or "unknown"
+            if peer_state in ("suspected_fragment", "confirmed_fragment"):
+                return "pos"
+            # Status and trust only matter once the fragment check has failed.
+            peer_status = data.get("status")
+            peer_trust = float(data.get("trust_score", 0.0) or 0.0)
+            if peer_state == "rejected_fragment" or (
+                peer_status == "trusted" and peer_trust >= 2
+            ):
+                return "neg"
+        except Exception as e:
+            logger.error(
+                f"Error fetching fragment opinion from {peer_url}: {e}"
+            )
+        return None
+
+    @staticmethod
+    def _apply_fragment_updates(
+        cur: sqlite3.Cursor,
+        updates: list[tuple[str, str, float, str | None]],
+    ) -> None:
+        """Write (fact_id, state, score, reason) rows in a single statement.
+
+        UPDATE ... FROM needs SQLite 3.33+; older libraries fall back to executemany.
+        """
+        if sqlite3.sqlite_version_info < (3, 33, 0):
+            cur.executemany(
+                """
+                UPDATE facts
+                SET fragment_state = ?, fragment_score = ?, fragment_reason = ?
+                WHERE fact_id = ?
+                """,
+                [(s, sc, r, fid) for fid, s, sc, r in updates],
+            )
+            return
+        values = ",".join(["(?, ?, ?, ?)"] * len(updates))
+        cur.execute(
+            f"""
+            WITH v(fact_id, state, score, reason) AS (VALUES {values})
+            UPDATE facts
+            SET fragment_state = v.state,
+                fragment_score = v.score,
+                fragment_reason = v.reason
+            FROM v
+            WHERE facts.fact_id = v.fact_id
+            """,  # noqa: S608 - only "?" placeholders are interpolated
+            [param for row in updates for param in row],
+        )
+
     # --- Helpers for meta-commands exposed via /think ---
 
     def get_system_map_summary(self) -> str:
         """Return a summary of the system map."""
         if not self._code_map:
             return "System map is not ready yet. Idle introspection will build it shortly."
+        cached = self._system_map_summary_cache
+        if cached is not None and cached[0] == self._code_map_version:
+            return cached[1]
         module_count = len(self._code_map)
         # Highlight a few key modules if present.
-        interesting = [
-            name
-            for name in self._code_map
-            if any(
-                key in name
-                for key in (
-                    "node.py",
-                    "crucible",
-                    "synthesizer",
-                    "blockchain",
-                    "p2p",
-                )
-            )
-        ]
-        interesting = sorted(set(interesting))[:8]
+        interesting = heapq.nsmallest(
+            8,
+            {
+                name
+                for name in self._code_map
+                if any(key in name for key in _KEY_MODULE_HINTS)
+            },
+        )
         parts = [f"I currently see {module_count} Python modules under src/."]
         if interesting:
             parts.append(
                 "Key subsystems include: " + ", ".join(interesting) + "."
             )
-        return " ".join(parts)
+        summary = " ".join(parts)
+        self._system_map_summary_cache = (self._code_map_version, summary)
+        return summary
 
     def get_endpoints_summary(self) -> str:
         """Return a summary of the HTTP endpoints."""
         if not self._endpoint_registry:
             return "Endpoint registry is not ready yet. Idle code introspection will populate it."
+        cached = self._endpoints_summary_cache
+        if cached is not None and cached[0] == self._code_map_version:
+            return cached[1]
         lines = []
         for ep in self._endpoint_registry[:20]:
             path = ep.get("path") or "/"
@@ -981,7 +1106,9 @@ class AxiomNode:
         extra = ""
         if len(self._endpoint_registry) > 20:
             extra = f" (+{len(self._endpoint_registry) - 20} more)"
-        return "Exposed HTTP endpoints:\n" + "\n".join(lines) + extra
+        summary = "Exposed HTTP endpoints:\n" + "\n".join(lines) + extra
+        self._endpoints_summary_cache = (self._code_map_version, summary)
+        return summary
 
     def get_health_summary(self) -> str:
         """Return a summary of the node's health."""
@@ -1028,12 +1155,20 @@ class AxiomNode:
             "last_fragment_audit_age_sec": age(self._last_fragment_audit_ts),
         }
 
-    def _run_idle_tick(self) -> None:
-        """Run a single idle task, if any are registered."""
-        if not self.idle_tasks:
-            return
-        task = self.idle_tasks[self._idle_task_index % len(self.idle_tasks)]
-        self._idle_task_index += 1
+    def register_idle_task(
+        self, task: Callable[[], None], interval: float
+    ) -> None:
+        """Register an idle task to run at most once every `interval` seconds.
+
+        New tasks are due immediately so the first idle suite exercises them.
+        """
+        self.idle_tasks.append(task)
+        heapq.heappush(
+            self._idle_schedule,
+            (time.monotonic(), len(self.idle_tasks), interval, task),
+        )
+
+    def _run_idle_task(self, task: Callable[[], None]) -> None:
         try:
             task()
         except Exception as e:
@@ -1043,52 +1178,48 @@ class AxiomNode:
                 e,
             )
 
+    def _run_idle_tick(self) -> None:
+        """Run the next idle task, if it is due."""
+        now = time.monotonic()
+        if not self._idle_schedule or self._idle_schedule[0][0] > now:
+            return
+        _, seq, interval, task = heapq.heappop(self._idle_schedule)
+        self._run_idle_task(task)
+        heapq.heappush(
+            self._idle_schedule, (now + interval, seq, interval, task)
+        )
+
     def _run_idle_suite(self) -> None:
-        """Run all registered idle tasks in a fixed sequence so their logs
+        """Run every due idle task in registration order so their logs
 
         appear grouped together for easier debugging.
         """
-        if not self.idle_tasks:
+        if not self._idle_schedule:
             return
         self._idle_suite_header_active = False
-        for task in self.idle_tasks:
-            try:
-                task()
-            except Exception as e:
-                logger.info(
-                    "[Idle] Task %s skipped: %s",
-                    getattr(task, "__name__", "unknown"),
-                    e,
-                )
+        now = time.monotonic()
+        due = []
+        while self._idle_schedule and self._idle_schedule[0][0] <= now:
+            due.append(heapq.heappop(self._idle_schedule))
+        if not due:
+            next_run, _, _, task = self._idle_schedule[0]
+            logger.debug(
+                "[Idle:%s] Nothing due; %s next eligible in %.0fs.",
+                self.port,
+                getattr(task, "__name__", "unknown"),
+                next_run - now,
+            )
+            return
+        # Reschedule only after the whole batch has been collected so a
+        # zero-interval task cannot be popped twice in one suite.
+        for _, seq, interval, task in sorted(due, key=lambda entry: entry[1]):
+            self._run_idle_task(task)
+            heapq.heappush(
+                self._idle_schedule, (now + interval, seq, interval, task)
+            )
         if self._idle_suite_header_active:
             logger.info("[Idle-Suite:%s] End.", self.port)
 
-    def _maybe_log_idle_throttle(
-        self,
-        name: str,
-        interval: float,
-        now: float,
-        last_run_ts: float,
-    ) -> None:
-        """Log idle tasks being throttled
-
-        rate-limit those logs so they do not flood the console.
-        """
-        last_log_ts = self._idle_throttle_log.get(name, 0.0)
-        # At most once per 60s per task.
-        if now - last_log_ts < 60.0:
-            return
-        elapsed = now - last_run_ts if last_run_ts else 0.0
-        remaining = max(0.0, interval - elapsed)
-        logger.debug(
-            "[Idle-%s:%s] Throttled; next eligible in %.0fs (elapsed %.0fs).",
-            name,
-            self.port,
-            remaining,
-            elapsed,
-        )
-        self._idle_throttle_log[name] = now
-
     def _ensure_idle_suite_header(self) -> None:
         """Ensure we only emit the Idle-Suite Start line once per suite,
 
@@ -1102,10 +1233,12 @@ class AxiomNode:
     def _background_loop(self) -> None:
         """Start loop cycles."""
         logger.info("Starting continuous background cycle.")
-        next_cycle = time.time()
-        next_idle_suite = time.time() + self.idle_suite_interval
-        while True:
-            now = time.time()
+        # Deadlines are monotonic so wall-clock (NTP) jumps never fire or
+        # starve cycles; waiting on _stop lets stop_background_tasks() wake it.
+        next_cycle = time.monotonic()
+        next_idle_suite = next_cycle + self.idle_suite_interval
+        while not self._stop.is_set():
+            now = time.monotonic()
             if now >= next_cycle:
                 self._run_main_cycle()
                 next_cycle = now + self.main_cycle_interval
@@ -1118,7 +1251,8 @@ class AxiomNode:
                     max(0.0, next_idle_suite - now),
                     max(0.0, next_cycle - now),
                 )
-                time.sleep(sleep_for)
+                self._stop.wait(sleep_for)
+        logger.info("Background cycle stopped.")
 
     def _prune_ledger(self) -> None:
         """Delete old, uncorroborated facts and manage node storage size."""
@@ -1130,8 +1264,9 @@ class AxiomNode:
             f"[Housekeeping] Pruning facts older than {prune_threshold_days} days...",
         )
 
-        conn = sqlite3.connect(self.db_path)
+        conn = open_connection(self.db_path)
         cursor = conn.cursor()
+        cursor.execute("BEGIN IMMEDIATE")
         cursor.execute(
             """
             DELETE FROM facts
@@ -1157,10 +1292,34 @@ class AxiomNode:
         )
         background_thread.start()
 
+    def stop_background_tasks(self) -> None:
+        """Ask the background loop to exit after its current step."""
+        self._stop.set()
+
 
 node_instance: AxiomNode | None = None
 
 
+def _peer_json(payload: dict[str, Any]) -> Response:
+    """Build a JSON response for bulk peer-sync endpoints via the fast encoder."""
+    return app.response_class(dumps_json(payload), mimetype="application/json")
+
+
+@contextlib.contextmanager
+def _request_conn() -> Iterator[sqlite3.Connection]:
+    """Borrow a pooled ledger connection for the current request.
+
+    The server starts a thread per request, so per-thread connections would
+    never be reused; the bounded ledger pool is shared across them instead.
+    """
+    db_path = node_instance.db_path
+    conn = acquire_connection(db_path)
+    try:
+        yield conn
+    finally:
+        release_connection(conn, db_path)
+
+
 def _register_sync_caller() -> None:
     """Sync Caller Registration."""
     if node_instance is None:
@@ -1233,7 +1392,18 @@ def handle_get_blocks_after() -> Response | tuple[Response, int]:
     except (TypeError, ValueError):
         height = -1
     blocks = get_blocks_after(height, db_path=node_instance.db_path)
-    return jsonify({"blocks": blocks})
+    return _peer_json({"blocks": blocks})
+
+
+@app.route("/get_ledger_root", methods=["GET"])
+def handle_get_ledger_root() -> Response | tuple[Response, int]:
+    """Route api for a digest of the fact-ID set, so synced peers skip the ID list."""
+    if node_instance is None:
+        return jsonify({"error": "Node not initialized"}), 503
+    _register_sync_caller()
+    with _request_conn() as conn:
+        root, head = get_ledger_root(conn, node_instance.db_path)
+    return jsonify({"root": root, "cursor": head})
 
 
 @app.route("/get_fact_ids", methods=["GET"])
@@ -1242,12 +1412,60 @@ def handle_get_fact_ids() -> Response | tuple[Response, int]:
     if node_instance is None:
         return jsonify({"error": "Node not initialized"}), 503
     _register_sync_caller()
-    conn = sqlite3.connect(node_instance.db_path)
+    since = request.args.get("since", default=0, type=int)
+    # The cursor is read while the response streams, so the connection goes
+    # back to the pool only once the response is closed.
+    db_path = node_instance.db_path
+    conn = acquire_connection(db_path)
     cursor = conn.cursor()
-    cursor.execute("SELECT fact_id FROM facts")
-    fact_ids = [row[0] for row in cursor.fetchall()]
-    conn.close()
-    return jsonify({"fact_ids": fact_ids})
+
+    def release() -> None:
+        cursor.close()
+        release_connection(conn, db_path)
+
+    try:
+        # "cursor" tells the caller where to resume: only IDs stored after it
+        # (by rowid) are sent when it comes back with ?since=.
+        head = (
+            cursor.execute("SELECT MAX(rowid) FROM facts").fetchone()[0] or 0
+        )
+        if since > 0:
+            cursor.execute(
+                "SELECT fact_id FROM facts WHERE rowid > ? AND rowid <= ?",
+                (since, head),
+            )
+        else:
+            cursor.execute("SELECT fact_id FROM facts")
+    except Exception:
+        release()
+        raise
+
+    def generate() -> Iterator[bytes]:
+        # Emit {"fact_ids": [...], "cursor": N} in slices so memory stays
+        # flat however large the ledger is.
+        yield b'{"fact_ids":['
+        first = True
+        while rows := cursor.fetchmany(FACT_ID_STREAM_BATCH):
+            encoded = dumps_json([row[0] for row in rows])[1:-1]
+            yield encoded if first else b"," + encoded
+            first = False
+        yield b'],"cursor":' + str(head).encode() + b"}"
+
+    # Hex IDs compress well (about 2x), and the ID list is the largest body
+    # a full sync sends.
+    if _accepts_gzip():
+        response = Response(
+            stream_with_context(_gzip_stream(generate())),
+            mimetype="application/json",
+        )
+        response.headers["Content-Encoding"] = "gzip"
+        response.vary.add("Accept-Encoding")
+    else:
+        response = Response(
+            stream_with_context(generate()), mimetype="application/json"
+        )
+    response.call_on_close(release)
+    return response
 
 
 @app.route("/get_facts_by_id", methods=["POST"])
@@ -1258,12 +1476,27 @@ def handle_get_facts_by_id() -> Response | tuple[Response, int]:
     _register_sync_caller()
     req_json = request.json or {}
     requested_ids = req_json.get("fact_ids", [])
-    all_facts = node_instance.search_ledger_for_api(
-        "",
-        include_uncorroborated=True,
+    if not isinstance(requested_ids, list):
+        return jsonify({"error": "fact_ids must be a list"}), 400
+    facts_to_return = get_facts_by_ids(
+        requested_ids, db_path=node_instance.db_path
     )
-    facts_to_return = [f for f in all_facts if f["fact_id"] in requested_ids]
-    return jsonify({"facts": facts_to_return})
+    response = _peer_json({"facts": facts_to_return})
+    response.headers[HASH_ALGO_HEADER] = FACT_HASH_ALGO
+    return response
+
+
+# /think meta-commands mapped to the AxiomNode summary method that answers them.
+_THINK_MACROS: dict[str, str] = {
+    "axiom: status": "get_health_summary",
+    "show health": "get_health_summary",
+    "axiom: map": "get_system_map_summary",
+    "list modules": "get_system_map_summary",
+    "show endpoints": "get_endpoints_summary",
+}
+# Longer queries cannot collapse to a macro unless padded with whitespace;
+# this bound keeps the normalization retry to short inputs.
+_THINK_MACRO_MAX_LEN = 32
 
 
 @app.route("/think", methods=["GET"])
@@ -1275,13 +1508,14 @@ def handle_thinking() -> Response | tuple[Response, int]:
     if not query:
         return jsonify({"response": "System standby. Awaiting input."})
 
-    normalized = " ".join(query.strip().lower().split())
-    if normalized in ("axiom: status", "show health"):
-        return jsonify({"response": node_instance.get_health_summary()})
-    if normalized in ("axiom: map", "list modules"):
-        return jsonify({"response": node_instance.get_system_map_summary()})
-    if normalized == "show endpoints":
-        return jsonify({"response": node_instance.get_endpoints_summary()})
+    # Polled status macros hit the dict directly; only queries that miss
+    # pay for whitespace collapsing before the second lookup.
+    stripped = query.strip().lower()
+    macro = _THINK_MACROS.get(stripped)
+    if macro is None and len(stripped) <= _THINK_MACRO_MAX_LEN:
+        macro = _THINK_MACROS.get(" ".join(stripped.split()))
+    if macro is not None:
+        return jsonify({"response": getattr(node_instance, macro)()})
 
     handled = False
     direct_answer = ""
@@ -1344,35 +1578,28 @@ def handle_fragment_opinion() -> Response | tuple[Response, int]:
     if not fact_id:
         return jsonify({"error": "Missing fact_id"}), 400
 
-    import sqlite3 as _sqlite3
-
-    conn = _sqlite3.connect(node_instance.db_path)
-    cur = conn.cursor()
-    try:
-        cur.execute(
+    with _request_conn() as conn:
+        row = conn.execute(
             """
             SELECT status, trust_score, fragment_state, fragment_score
             FROM facts
             WHERE fact_id = ?
             """,
             (fact_id,),
-        )
-        row = cur.fetchone()
-        if not row:
-            return jsonify({"seen": False})
-
-        status, trust_score, fragment_state, fragment_score = row
-        return jsonify(
-            {
-                "seen": True,
-                "status": status,
-                "trust_score": float(trust_score or 0.0),
-                "fragment_state": fragment_state or "unknown",
-                "fragment_score": float(fragment_score or 0.0),
-            }
-        )
-    finally:
-        conn.close()
+        ).fetchone()
+    if not row:
+        return jsonify({"seen": False})
+
+    status, trust_score, fragment_state, fragment_score = row
+    return jsonify(
+        {
+            "seen": True,
+            "status": status,
+            "trust_score": float(trust_score or 0.0),
+            "fragment_state": fragment_state or "unknown",
+            "fragment_score": float(fragment_score or 0.0),
+        }
+    )
 
 
 if __name__ == "__main__":
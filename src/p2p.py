@@ -1,28 +1,326 @@
 """Confifgure the logic for the p2p mesh."""
 
-import hashlib
+import json
 import logging
-import sqlite3
-import zlib
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from typing import Any
 
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+# Optional: orjson speeds up the bulk sync payloads; json is the fallback.
+try:
+    import orjson
+except ImportError:
+    orjson = None  # type: ignore[assignment]
 
 from src.blockchain import (
-    append_block,
+    append_blocks,
     get_chain_head,
     replace_chain_with_peer_blocks,
 )
+from src.config import SYNC_FETCH_WORKERS
+from src.ledger import (
+    FACT_HASH_ALGO,
+    FACT_HASHES,
+    acquire_connection,
+    compress_fact_bytes,
+    get_ledger_root,
+    release_connection,
+)
 
 logger = logging.getLogger(__name__)
 
+# (connect, read) seconds: unreachable peers fail fast on connect while
+# slow-but-alive peers still get the full read window for large payloads.
+CONNECT_TIMEOUT = 3
+
+# Incremental ID syncs resume from the peer's rowid cursor, but a full ID
+# exchange still runs this often per peer (seconds) to catch anything a
+# cursor can miss, such as rowids reused after pruning.
+FULL_ID_SYNC_INTERVAL = 3600
+
+# Peer ID lists up to this size are checked with a single IN query; SQLite
+# caps bound parameters at 999 on older builds.
+DIRECT_PROBE_MAX_IDS = 900
+
+# Response header naming the hash a peer derives new fact IDs with.
+HASH_ALGO_HEADER = "X-Axiom-Hash-Algo"
+
+# Fact IDs requested per /get_facts_by_id call.
+FETCH_CHUNK_SIZE = 50
+# Rows per executemany call when storing facts received from a peer.
+INSERT_BATCH_SIZE = 5000
+# Below this many incoming facts, encoding runs inline instead of on threads.
+PARALLEL_ENCODE_MIN_FACTS = 256
+# Facts verified and compressed per worker task.
+ENCODE_SLICE_SIZE = 128
+
+
+def build_peer_session(
+    pool_maxsize: int = 64, retries: int = 2
+) -> requests.Session:
+    """Create a keep-alive session that retries transient peer failures.
+
+    Idempotent requests that fail to connect or get a 502/503/504 reply are
+    retried `retries` times with a short backoff, so one hiccup does not
+    abort a whole sync. Read timeouts and POSTs are never retried, so a
+    caller's timeout stays its time budget; callers with a hard deadline
+    should pass retries=0.
+    """
+    retry = Retry(
+        total=retries,
+        read=0,
+        backoff_factor=0.2,
+        status_forcelist=(502, 503, 504),
+        allowed_methods=Retry.DEFAULT_ALLOWED_METHODS,
+        raise_on_status=False,
+    )
+    adapter = HTTPAdapter(
+        pool_connections=32, pool_maxsize=pool_maxsize, max_retries=retry
+    )
+    session = requests.Session()
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    return session
+
+
+# Fallback for callers whose node does not carry its own session.
+_SESSION = build_peer_session()
+
+
+def _session_for(node_instance: Any) -> requests.Session:
+    return getattr(node_instance, "http", None) or _SESSION
+
+
+def dumps_json(payload: Any) -> bytes:
+    """Serialize a peer payload, using orjson when it is installed."""
+    if orjson is not None:
+        return orjson.dumps(payload)
+    return json.dumps(payload, separators=(",", ":")).encode("utf-8")
+
 
-def verify_hash(content: str | None, fact_id: str | None) -> bool:
-    """Ensure the fact ID is the mathematical hash of the content."""
-    if not content or not fact_id:
+def loads_json(data: bytes | str) -> Any:
+    """Parse a peer payload, using orjson when it is installed."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def verify_hash(
+    content: str | bytes | None,
+    fact_id: str | None,
+    algo: str | None = None,
+) -> bool:
+    """Ensure the fact ID is the mathematical hash of the content.
+
+    Pass UTF-8 bytes when the caller needs them anyway, to skip re-encoding.
+    The peer's declared hash is tried first; the others still match, since
+    a ledger keeps its legacy sha256 IDs after switching algorithms.
+    """
+    if not content or not fact_id or not isinstance(fact_id, str):
         return False
-    calculated_hash = hashlib.sha256(content.encode("utf-8")).hexdigest()
-    return calculated_hash == fact_id
+    if isinstance(content, str):
+        content = content.encode("utf-8")
+    # A hexdigest is always 64 lowercase hex chars, so padded, split or
+    # upper-case IDs never match.
+    first = algo if algo in FACT_HASHES else FACT_HASH_ALGO
+    if FACT_HASHES[first](content).hexdigest() == fact_id:
+        return True
+    return any(
+        FACT_HASHES[other](content).hexdigest() == fact_id
+        for other in FACT_HASHES
+        if other != first
+    )
+
+
+def _prepare_fact_row(
+    fact: dict[str, Any], peer_url: str
+) -> tuple[Any, ...] | None:
+    """Verify and compress one peer fact into an INSERT row, or None to drop it."""
+    content_text = fact.get("fact_content") or ""
+    # Encode once: the same bytes are hashed and then stored.
+    content_bytes = (
+        content_text.encode("utf-8") if isinstance(content_text, str) else b""
+    )
+    if not verify_hash(
+        content_bytes, fact.get("fact_id"), fact.get("hash_algo")
+    ):
+        logger.warning(
+            f"\033[91m[P2P Security] WARNING: Peer {peer_url} sent invalid hash. Dropping.\033[0m",
+        )
+        return None
+
+    incoming_trust = float(fact.get("trust_score", 0.1))
+    sanitized_trust = min(incoming_trust, 0.5)
+
+    try:
+        compressed_content = compress_fact_bytes(content_bytes)
+    except Exception as e:
+        logger.warning(
+            f"\033[91m[P2P Sync] Could not compress incoming fact {fact.get('fact_id', '')[:8]} from {peer_url}: {e}\033[0m"
+        )
+        return None
+    return (
+        fact["fact_id"],
+        compressed_content,
+        fact.get("source_url", "unknown_peer"),
+        fact.get("ingest_timestamp_utc"),
+        sanitized_trust,
+        "uncorroborated",
+    )
+
+
+def _missing_fact_ids(cursor: Any, peer_fact_ids: list[str]) -> list[str]:
+    """Return the peer IDs absent locally, in key order.
+
+    The facts primary key is the membership index, so no local ID is ever
+    read into Python. Small lists (the usual incremental-sync delta) probe
+    it with one IN query; larger ones go into a TEMP table for an anti-join.
+    """
+    wanted = sorted({fid for fid in peer_fact_ids if isinstance(fid, str)})
+    if len(wanted) <= DIRECT_PROBE_MAX_IDS:
+        if not wanted:
+            return []
+        placeholders = ",".join("?" * len(wanted))
+        cursor.execute(
+            f"SELECT fact_id FROM facts WHERE fact_id IN ({placeholders})",  # noqa: S608
+            wanted,
+        )
+        present = {row[0] for row in cursor.fetchall()}
+        return [fid for fid in wanted if fid not in present]
+
+    cursor.execute(
+        "CREATE TEMP TABLE IF NOT EXISTS peer_ids (fact_id TEXT PRIMARY KEY) WITHOUT ROWID"
+    )
+    try:
+        # One transaction for the temp inserts, also on autocommit connections.
+        cursor.execute("BEGIN")
+        cursor.executemany(
+            "INSERT OR IGNORE INTO peer_ids (fact_id) VALUES (?)",
+            ((fid,) for fid in wanted),
+        )
+        cursor.execute(
+            """
+            SELECT p.fact_id FROM peer_ids AS p
+            WHERE NOT EXISTS (SELECT 1 FROM facts AS f WHERE f.fact_id = p.fact_id)
+            ORDER BY p.fact_id
+            """
+        )
+        return [row[0] for row in cursor.fetchall()]
+    finally:
+        cursor.execute("DROP TABLE IF EXISTS temp.peer_ids")
+        # Close the implicit transaction the temp inserts opened, so the
+        # caller can start its own BEGIN IMMEDIATE for the fact inserts.
+        cursor.connection.commit()
+
+
+def _fetch_fact_chunk(
+    http: requests.Session,
+    peer_url: str,
+    chunk: list[str],
+    headers: dict[str, str],
+) -> list[dict[str, Any]] | None:
+    """Fetch one chunk of facts from a peer, or None if the request failed."""
+    try:
+        resp = http.post(
+            f"{peer_url}/get_facts_by_id",
+            json={"fact_ids": chunk},
+            timeout=(CONNECT_TIMEOUT, 20),
+            headers=headers,
+        )
+        resp.raise_for_status()
+        facts = loads_json(resp.content).get("facts", [])
+        # Peers advertise the hash their new fact IDs use.
+        algo = resp.headers.get(HASH_ALGO_HEADER)
+        if algo:
+            for fact in facts:
+                fact.setdefault("hash_algo", algo)
+        return facts
+    except Exception as e:
+        logger.error(
+            f"\033[91m[P2P Sync] Error fetching batch from {peer_url}: {e}\033[0m",
+        )
+        return None
+
+
+def _load_sync_cursor(cursor: Any, peer_url: str) -> int:
+    """Return the peer rowid to resume ID sync from; 0 asks for a full exchange."""
+    row = cursor.execute(
+        "SELECT fact_cursor, last_full_sync FROM peer_sync_state WHERE peer_url = ?",
+        (peer_url,),
+    ).fetchone()
+    if row is None or time.time() - row[1] >= FULL_ID_SYNC_INTERVAL:
+        return 0
+    return int(row[0])
+
+
+def _save_sync_cursor(
+    cursor: Any,
+    peer_url: str,
+    fact_cursor: int,
+    full_sync_at: float | None = None,
+) -> None:
+    """Record the peer cursor; full_sync_at marks a completed full exchange."""
+    cursor.execute(
+        """
+        INSERT INTO peer_sync_state (peer_url, fact_cursor, last_full_sync)
+        VALUES (?, ?, COALESCE(?, 0))
+        ON CONFLICT(peer_url) DO UPDATE SET
+            fact_cursor = excluded.fact_cursor,
+            last_full_sync = COALESCE(?, last_full_sync)
+        """,
+        (peer_url, fact_cursor, full_sync_at, full_sync_at),
+    )
+    cursor.connection.commit()
+
+
+def _ledger_roots_match(
+    http: requests.Session,
+    peer_url: str,
+    headers: dict[str, str],
+    conn: Any,
+    cursor: Any,
+    db_path: str,
+) -> bool:
+    """Compare ledger roots before a full ID exchange; record the sync on a match.
+
+    Any failure (including peers without /get_ledger_root) means no match,
+    so the caller falls back to exchanging IDs.
+    """
+    try:
+        resp = http.get(
+            f"{peer_url}/get_ledger_root",
+            timeout=(CONNECT_TIMEOUT, 5),
+            headers=headers,
+        )
+        if resp.status_code != 200:
+            return False
+        payload = loads_json(resp.content)
+    except Exception:
+        return False
+    peer_cursor = payload.get("cursor")
+    if not isinstance(peer_cursor, int):
+        return False
+    if payload.get("root") != get_ledger_root(conn, db_path)[0]:
+        return False
+    _save_sync_cursor(cursor, peer_url, peer_cursor, time.time())
+    return True
+
+
+def _prepare_fact_rows(
+    facts: list[dict[str, Any]], peer_url: str
+) -> list[tuple[Any, ...]]:
+    """Prepare INSERT rows for a slice of peer facts, dropping invalid ones."""
+    rows = []
+    for fact in facts:
+        row = _prepare_fact_row(fact, peer_url)
+        if row is not None:
+            rows.append(row)
+    return rows
 
 
 def sync_with_peer(
@@ -36,15 +334,18 @@ def sync_with_peer(
     conn = None
     try:
         headers = {"X-Axiom-Peer": node_instance.advertised_url}
+        http = _session_for(node_instance)
 
         try:
-            peer_list_resp = requests.get(
+            peer_list_resp = http.get(
                 f"{peer_url}/get_peers",
-                timeout=5,
+                timeout=(CONNECT_TIMEOUT, 5),
                 headers=headers,
             )
             if peer_list_resp.status_code == 200:
-                discovered_peers = peer_list_resp.json().get("peers", {})
+                discovered_peers = loads_json(peer_list_resp.content).get(
+                    "peers", {}
+                )
                 for p_url in discovered_peers:
                     if p_url != node_instance.advertised_url:
                         node_instance.add_or_update_peer(p_url)
@@ -53,96 +354,124 @@ def sync_with_peer(
                 f"[P2P Discovery] Could not fetch peer list from {peer_url}",
             )
 
-        response = requests.get(
+        # USE THE PASSED db_path
+        conn = acquire_connection(db_path)
+        cursor = conn.cursor()
+
+        # Ask only for IDs the peer stored since the last sync; peers that
+        # predate cursors ignore `since` and send everything.
+        since = _load_sync_cursor(cursor, peer_url)
+        if since == 0 and _ledger_roots_match(
+            http, peer_url, headers, conn, cursor, db_path
+        ):
+            logger.info(
+                f"\033[93m[P2P Sync] Ledger root matches {peer_url}; already up-to-date.\033[0m",
+            )
+            return "SUCCESS_UP_TO_DATE", []
+        response = http.get(
             f"{peer_url}/get_fact_ids",
-            timeout=10,
+            params={"since": since} if since else None,
+            timeout=(CONNECT_TIMEOUT, 10),
             headers=headers,
         )
         response.raise_for_status()
-        peer_fact_ids = set(response.json().get("fact_ids", []))
-
-        # USE THE PASSED db_path
-        conn = sqlite3.connect(db_path)
-        cursor = conn.cursor()
-        cursor.execute("SELECT fact_id FROM facts")
-        local_fact_ids = {row[0] for row in cursor.fetchall()}
-
-        missing_fact_ids = list(peer_fact_ids - local_fact_ids)
+        ids_payload = loads_json(response.content)
+        peer_fact_ids = ids_payload.get("fact_ids", [])
+        peer_cursor = ids_payload.get("cursor")
+        if not isinstance(peer_cursor, int):
+            peer_cursor = None
+        elif peer_cursor < since:
+            # The peer's ledger shrank or was rebuilt: start over next time.
+            _save_sync_cursor(cursor, peer_url, 0, full_sync_at=0)
+            peer_cursor = None
+        full_sync_at = time.time() if since == 0 else None
+
+        missing_fact_ids = _missing_fact_ids(cursor, peer_fact_ids)
 
         if not missing_fact_ids:
+            if peer_cursor is not None:
+                _save_sync_cursor(cursor, peer_url, peer_cursor, full_sync_at)
             logger.info(
                 f"\033[93m[P2P Sync] Ledger is already up-to-date with {peer_url}.\033[0m",
             )
-            conn.close()
             return "SUCCESS_UP_TO_DATE", []
 
         logger.info(
             f"\033[92m[P2P Sync] Found {len(missing_fact_ids)} new facts. Requesting data...\033[0m",
         )
 
-        chunk_size = 50
-        facts_added_count = 0
+        # Chunk requests share the keep-alive pool and run side by side on a
+        # dedicated executor, so a sync never competes with (or waits on)
+        # other work queued on the node's general thread pool.
+        chunks = [
+            missing_fact_ids[i : i + FETCH_CHUNK_SIZE]
+            for i in range(0, len(missing_fact_ids), FETCH_CHUNK_SIZE)
+        ]
         new_facts_payload: list[dict[str, Any]] = []
-
-        for i in range(0, len(missing_fact_ids), chunk_size):
-            chunk = missing_fact_ids[i : i + chunk_size]
-            try:
-                resp = requests.post(
-                    f"{peer_url}/get_facts_by_id",
-                    json={"fact_ids": chunk},
-                    timeout=20,
-                    headers=headers,
-                )
-                resp.raise_for_status()
-                batch = resp.json().get("facts", [])
-                new_facts_payload.extend(batch)
-            except Exception as e:
-                logger.error(
-                    f"\033[91m[P2P Sync] Error fetching batch from {peer_url}: {e}\033[0m",
+        # The cursor only advances when every chunk arrived, so failed
+        # fetches are retried on the next sync.
+        fetch_failed = False
+        workers = max(1, min(SYNC_FETCH_WORKERS, len(chunks)))
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            futures = [
+                executor.submit(
+                    _fetch_fact_chunk, http, peer_url, chunk, headers
                 )
-                continue
-
-        for fact in new_facts_payload:
-            content_text = fact.get("fact_content") or ""
-            if not verify_hash(content_text, fact.get("fact_id")):
-                logger.warning(
-                    f"\033[91m[P2P Security] WARNING: Peer {peer_url} sent invalid hash. Dropping.\033[0m",
-                )
-                continue
-
-            incoming_trust = float(fact.get("trust_score", 0.1))
-            sanitized_trust = min(incoming_trust, 0.5)
-
-            try:
+                for chunk in chunks
+            ]
+            for future in as_completed(futures):
                 try:
-                    compressed_content = zlib.compress(
-                        content_text.encode("utf-8")
-                    )
+                    facts = future.result()
                 except Exception as e:
-                    logger.warning(
-                        f"\033[91m[P2P Sync] Could not compress incoming fact {fact.get('fact_id', '')[:8]} from {peer_url}: {e}\033[0m"
+                    facts = None
+                    logger.error(
+                        f"\033[91m[P2P Sync] Chunk fetch from {peer_url} failed: {e}\033[0m",
+                    )
+                if facts is None:
+                    fetch_failed = True
+                else:
+                    new_facts_payload.extend(facts)
+
+        # zlib releases the GIL, so large bootstrap batches are verified and
+        # compressed across cores, one slice per task to amortize hand-off;
+        # small batches stay inline where threads would cost more than they
+        # save.
+        if len(new_facts_payload) >= PARALLEL_ENCODE_MIN_FACTS:
+            slices = [
+                new_facts_payload[i : i + ENCODE_SLICE_SIZE]
+                for i in range(0, len(new_facts_payload), ENCODE_SLICE_SIZE)
+            ]
+            workers = min(os.cpu_count() or 4, len(slices))
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                rows = [
+                    row
+                    for prepared in executor.map(
+                        lambda facts: _prepare_fact_rows(facts, peer_url),
+                        slices,
                     )
-                    continue
-                cursor.execute(
-                    """
-                    INSERT INTO facts (fact_id, fact_content, source_url, ingest_timestamp_utc, trust_score, status)
-                    VALUES (?, ?, ?, ?, ?, ?)
+                    for row in prepared
+                ]
+        else:
+            rows = _prepare_fact_rows(new_facts_payload, peer_url)
+
+        # One write transaction and one prepared statement for the batch.
+        # OR IGNORE skips rows that already exist or violate constraints,
+        # which is what the old per-row IntegrityError fallback did.
+        changes_before = conn.total_changes
+        cursor.execute("BEGIN IMMEDIATE")
+        for i in range(0, len(rows), INSERT_BATCH_SIZE):
+            cursor.executemany(
+                """
+                INSERT OR IGNORE INTO facts (fact_id, fact_content, source_url, ingest_timestamp_utc, trust_score, status)
+                VALUES (?, ?, ?, ?, ?, ?)
                 """,
-                    (
-                        fact["fact_id"],
-                        compressed_content,
-                        fact.get("source_url", "unknown_peer"),
-                        fact.get("ingest_timestamp_utc"),
-                        sanitized_trust,
-                        "uncorroborated",
-                    ),
-                )
-                facts_added_count += 1
-            except sqlite3.IntegrityError:
-                continue
+                rows[i : i + INSERT_BATCH_SIZE],
+            )
+        facts_added_count = conn.total_changes - changes_before
 
         conn.commit()
-        conn.close()
+        if peer_cursor is not None and not fetch_failed:
+            _save_sync_cursor(cursor, peer_url, peer_cursor, full_sync_at)
 
         if facts_added_count > 0:
             logger.info(
@@ -162,9 +491,10 @@ def sync_with_peer(
         return "CONNECTION_FAILED", []
     except Exception as e:
         logger.error(f"\033[91m[P2P Sync] General error: {e}\033[0m")
-        if conn:
-            conn.close()
         return "SYNC_ERROR", []
+    finally:
+        if conn is not None:
+            release_connection(conn, db_path)
 
 
 def sync_chain_with_peer(
@@ -176,13 +506,14 @@ def sync_chain_with_peer(
     """
     try:
         headers = {"X-Axiom-Peer": node_instance.advertised_url}
-        head_resp = requests.get(
+        http = _session_for(node_instance)
+        head_resp = http.get(
             f"{peer_url}/get_chain_head",
-            timeout=5,
+            timeout=(CONNECT_TIMEOUT, 5),
             headers=headers,
         )
         head_resp.raise_for_status()
-        peer_head = head_resp.json()
+        peer_head = loads_json(head_resp.content)
         peer_height = int(peer_head.get("height", -1))
 
         if peer_height < 0:
@@ -197,52 +528,45 @@ def sync_chain_with_peer(
             return 0, peer_height
 
         # If peer is ahead, try incremental sync first.
-        blocks_resp = requests.get(
+        blocks_resp = http.get(
             f"{peer_url}/get_blocks_after",
             params={"height": our_height},
-            timeout=15,
+            timeout=(CONNECT_TIMEOUT, 15),
             headers=headers,
         )
         blocks_resp.raise_for_status()
-        blocks = blocks_resp.json().get("blocks", [])
-
-        appended = 0
-        for blk in blocks:
-            if append_block(blk, db_path=db_path):
-                appended += 1
-            else:
-                # Incremental append failed (divergence detected).
-                # We must attempt to adopt the full chain if the peer is taller.
-                if peer_height > our_height:
-                    logger.warning(
-                        f"[P2P Chain] Divergence detected. Attempting full chain adoption from {peer_url} (Height {peer_height})."
+        blocks = loads_json(blocks_resp.content).get("blocks", [])
+
+        # One transaction for the whole batch; a short count means the
+        # incremental append hit a divergence.
+        appended = append_blocks(blocks, db_path=db_path)
+        if appended < len(blocks) and peer_height > our_height:
+            # Incremental append failed (divergence detected).
+            # We must attempt to adopt the full chain if the peer is taller.
+            logger.warning(
+                f"[P2P Chain] Divergence detected. Attempting full chain adoption from {peer_url} (Height {peer_height})."
+            )
+            try:
+                full_resp = http.get(
+                    f"{peer_url}/get_blocks_after",
+                    params={"height": 0},
+                    timeout=(CONNECT_TIMEOUT, 15),
+                    headers=headers,
+                )
+                full_resp.raise_for_status()
+                peer_blocks = loads_json(full_resp.content).get("blocks", [])
+                if peer_blocks and replace_chain_with_peer_blocks(
+                    peer_blocks, db_path=db_path
+                ):
+                    logger.info(
+                        f"\033[92m[P2P Chain] Adopted peer chain from {peer_url} (longest-chain wins, height now {peer_height}).\033[0m",
                     )
-                    try:
-                        full_resp = requests.get(
-                            f"{peer_url}/get_blocks_after",
-                            params={"height": 0},
-                            timeout=15,
-                            headers=headers,
-                        )
-                        full_resp.raise_for_status()
-                        peer_blocks = full_resp.json().get("blocks", [])
-                        if peer_blocks and replace_chain_with_peer_blocks(
-                            peer_blocks, db_path=db_path
-                        ):
-                            logger.info(
-                                f"\033[92m[P2P Chain] Adopted peer chain from {peer_url} (longest-chain wins, height now {peer_height}).\033[0m",
-                            )
-                            return len(peer_blocks), peer_height
-                        logger.error(
-                            "[P2P Chain] Chain adoption failed after divergence. Peer's full history starting at height 0 is unusable/inconsistent."
-                        )
-                    except Exception as e:
-                        logger.debug(
-                            f"[P2P Chain] Could not adopt peer chain: {e}"
-                        )
-
-                # Stop trying to append the rest of this partial batch
-                break
+                    return len(peer_blocks), peer_height
+                logger.error(
+                    "[P2P Chain] Chain adoption failed after divergence. Peer's full history starting at height 0 is unusable/inconsistent."
+                )
+            except Exception as e:
+                logger.debug(f"[P2P Chain] Could not adopt peer chain: {e}")
 
         if appended > 0:
             logger.info(
@@ -5,11 +5,15 @@ Conduct light sanity checks, not full tests.
 
 from __future__ import annotations
 
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from typing import TypedDict
 
 import requests
 
+# Reused across runs so self-checks keep one keep-alive connection to /think.
+_SESSION = requests.Session()
+
 
 @dataclass
 class SelfCheckCase:
@@ -45,42 +49,54 @@ SELF_CHECKS: list[SelfCheckCase] = [
 
 
 def run_self_checks(
-    base_url: str, timeout: float = 3.0
+    base_url: str,
+    timeout: float = 3.0,
+    session: requests.Session | None = None,
 ) -> list[SelfCheckResult]:
-    """Run a small suite of self-queries against /think and report pass/fail."""
-    results: list[SelfCheckResult] = []
-
-    for case in SELF_CHECKS:
-        try:
-            resp = requests.get(
-                f"{base_url}/think",
-                params={"query": case.query},
-                timeout=timeout,
-            )
-            resp.raise_for_status()
-
-            data = resp.json()
-            answer = str(data.get("response", "")).lower()
-
-            missing = [
-                kw for kw in case.must_contain if kw.lower() not in answer
-            ]
-            ok = not missing
-
-            results.append(
-                {
-                    "query": case.query,
-                    "ok": ok,
-                    "missing_keywords": missing,
-                }
+    """Run a small suite of self-queries against /think and report pass/fail.
+
+    The queries are independent, so they run concurrently; results keep the
+    order of SELF_CHECKS.
+    """
+    http = session or _SESSION
+    with ThreadPoolExecutor(max_workers=len(SELF_CHECKS)) as executor:
+        return list(
+            executor.map(
+                lambda case: _run_one_check(http, base_url, case, timeout),
+                SELF_CHECKS,
             )
-        except Exception as e:
-            results.append(
-                {
-                    "query": case.query,
-                    "ok": False,
-                    "error": str(e),
-                }
-            )
-
-    return results
+        )
+
+
+def _run_one_check(
+    http: requests.Session,
+    base_url: str,
+    case: SelfCheckCase,
+    timeout: float,
+) -> SelfCheckResult:
+    """Query /think once and check the answer for the case's keywords."""
+    try:
+        resp = http.get(
+            f"{base_url}/think",
+            params={"query": case.query},
+            timeout=timeout,
+        )
+        resp.raise_for_status()
+
+        data = resp.json()
+        answer = str(data.get("response", "")).lower()
+
+        missing = [kw for kw in case.must_contain if kw.lower() not in answer]
+        ok = not missing
+
+        return {
+            "query": case.query,
+            "ok": ok,
+            "missing_keywords": missing,
+        }
+    except Exception as e:
+        return {
+            "query": case.query,
+            "ok": False,
+            "error": str(e),
+        }
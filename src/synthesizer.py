@@ -1,45 +1,76 @@
 """Module for synthesizing data using natural language processing."""
 
+import contextlib
+import hashlib
+import json
 import logging
+import threading
 import zlib
+from collections import OrderedDict, defaultdict
 from typing import Any
 
 from src.axiom_model_loader import load_nlp_model
 from src.ledger import (
-    get_all_facts_for_analysis,
-    insert_relationship,
-    update_synapse,
+    decompress_fact_content,
+    insert_fact_links,
+    iter_facts_for_analysis,
+    store_fact_entities,
 )
 
 logger = logging.getLogger(__name__)
 
 NLP_MODEL = load_nlp_model()
 
-# Type hint added to global set
-IGNORED_ENTITIES: set[str] = {
-    "today",
-    "yesterday",
-    "tomorrow",
-    "year",
-    "years",
-    "week",
-    "weeks",
-    "percent",
-    "millions",
-    "billions",
-    "one",
-    "two",
-    "first",
-    "second",
-    "government",
-    "police",
-    "state",
-    "city",
-    "news",
-    "report",
-    "study",
+# Distinct texts whose weighted entities are kept in memory (LRU), keyed by
+# a text digest; repeats, such as syndicated facts, skip spaCy entirely.
+ENTITY_CACHE_SIZE = 65536
+_ENTITY_CACHE: OrderedDict[bytes, dict[str, int]] = OrderedDict()
+_ENTITY_CACHE_LOCK = threading.Lock()
+
+# Documents per spaCy pipe batch, and the stages NER does not read.
+ENTITY_PIPE_BATCH_SIZE = 64
+# Unparsed ledger facts buffered before they are piped as one group.
+ENTITY_PIPE_FLUSH_SIZE = 1024
+_NER_UNUSED_PIPES = ("tagger", "parser", "attribute_ruler", "lemmatizer")
+
+# Relevance weight per spaCy entity label; other labels are ignored.
+_ENTITY_WEIGHTS: dict[str, int] = {
+    "PERSON": 3,
+    "ORG": 3,
+    "EVENT": 3,
+    "WORK_OF_ART": 3,
+    "GPE": 1,
+    "PRODUCT": 1,
+    "LAW": 1,
 }
 
+# Type hint added to global set
+IGNORED_ENTITIES: frozenset[str] = frozenset(
+    {
+        "today",
+        "yesterday",
+        "tomorrow",
+        "year",
+        "years",
+        "week",
+        "weeks",
+        "percent",
+        "millions",
+        "billions",
+        "one",
+        "two",
+        "first",
+        "second",
+        "government",
+        "police",
+        "state",
+        "city",
+        "news",
+        "report",
+        "study",
+    }
+)
+
 
 def get_weighted_entities(text: str | None) -> dict[str, int]:
     """Extract entities and assign a 'relevance weight'.
@@ -48,29 +79,91 @@ def get_weighted_entities(text: str | None) -> dict[str, int]:
     """
     if not text or not NLP_MODEL:
         return {}
+    cached = _entity_cache_get(text)
+    if cached is not None:
+        return cached
+    entities = _weigh_entities(NLP_MODEL(text).ents)
+    _entity_cache_put(text, entities)
+    return dict(entities)
 
-    doc = NLP_MODEL(text)
-    # Fixed [var-annotated] by explicitly typing the empty dictionary
-    entities: dict[str, int] = {}
 
-    for ent in doc.ents:
-        clean_text = ent.text.lower().strip()
+def get_weighted_entities_batch(texts: list[str]) -> list[dict[str, int]]:
+    """Like get_weighted_entities for many texts, piping cache misses through spaCy.
 
-        if len(clean_text) < 3 or clean_text in IGNORED_ENTITIES:
-            continue
-        if clean_text.isdigit():
+    nlp.pipe amortizes per-document setup, and stages NER does not read
+    are skipped.
+    """
+    if not NLP_MODEL:
+        return [{} for _ in texts]
+    found: dict[str, dict[str, int]] = {"": {}}
+    misses: list[str] = []
+    for text in texts:
+        if text in found:
             continue
-
-        if ent.label_ in {"PERSON", "ORG", "EVENT", "WORK_OF_ART"}:
-            weight = 3
-        elif ent.label_ in {"GPE", "PRODUCT", "LAW"}:
-            weight = 1
+        cached = _entity_cache_get(text)
+        if cached is None:
+            found[text] = {}
+            misses.append(text)
         else:
-            continue
+            found[text] = cached
+    if misses:
+        disable = [
+            name for name in _NER_UNUSED_PIPES if name in NLP_MODEL.pipe_names
+        ]
+        docs = NLP_MODEL.pipe(
+            misses, batch_size=ENTITY_PIPE_BATCH_SIZE, disable=disable
+        )
+        for text, doc in zip(misses, docs, strict=True):
+            entities = _weigh_entities(doc.ents)
+            _entity_cache_put(text, entities)
+            found[text] = dict(entities)
+    return [dict(found[text]) if text else {} for text in texts]
 
-        if clean_text in entities:
-            entities[clean_text] = max(entities[clean_text], weight)
-        else:
+
+def _entity_cache_key(text: str) -> bytes:
+    # A 16-byte digest stands in for the text, so cached facts are not kept
+    # alive in memory and identical (syndicated) texts share one entry.
+    return hashlib.blake2b(text.encode("utf-8"), digest_size=16).digest()
+
+
+def _entity_cache_get(text: str) -> dict[str, int] | None:
+    key = _entity_cache_key(text)
+    with _ENTITY_CACHE_LOCK:
+        entities = _ENTITY_CACHE.get(key)
+        if entities is None:
+            return None
+        _ENTITY_CACHE.move_to_end(key)
+    # Copy so callers cannot mutate the cached result.
+    return dict(entities)
+
+
+def _entity_cache_put(text: str, entities: dict[str, int]) -> None:
+    key = _entity_cache_key(text)
+    with _ENTITY_CACHE_LOCK:
+        _ENTITY_CACHE[key] = entities
+        _ENTITY_CACHE.move_to_end(key)
+        if len(_ENTITY_CACHE) > ENTITY_CACHE_SIZE:
+            _ENTITY_CACHE.popitem(last=False)
+
+
+def _weigh_entities(ents: Any) -> dict[str, int]:
+    """Weight spaCy entity spans, dropping generic and numeric ones."""
+    # Fixed [var-annotated] by explicitly typing the empty dictionary
+    entities: dict[str, int] = {}
+
+    for ent in ents:
+        # Cheapest test first: most spans carry labels that are never kept.
+        weight = _ENTITY_WEIGHTS.get(ent.label_)
+        if weight is None:
+            continue
+        clean_text = ent.text.lower().strip()
+        if (
+            len(clean_text) < 3
+            or clean_text in IGNORED_ENTITIES
+            or clean_text.isdigit()
+        ):
+            continue
+        if weight > entities.get(clean_text, 0):
             entities[clean_text] = weight
 
     return entities
@@ -93,18 +186,28 @@ def link_related_facts(
     # Added typing to the empty list to satisfy strict linters
     new_facts_data: list[dict[str, Any]] = []
 
+    new_ids: list[str] = []
+    new_texts: list[str] = []
     for fact in new_facts_batch:
         content = fact.get("fact_content")
         if isinstance(content, (bytes, bytearray)):
             try:
-                content = zlib.decompress(content).decode("utf-8")
+                content = decompress_fact_content(content)
             except (zlib.error, ValueError, TypeError):
                 continue
         if not content:
             continue
-        ents = get_weighted_entities(content)
+        new_ids.append(fact["fact_id"])
+        new_texts.append(content)
+
+    # Kept by ID: the ledger scan below meets these facts again and reuses
+    # their entities instead of decompressing and parsing them a second time.
+    new_ents_by_id = dict(
+        zip(new_ids, get_weighted_entities_batch(new_texts), strict=True)
+    )
+    for fact_id, ents in new_ents_by_id.items():
         if ents:
-            new_facts_data.append({"id": fact["fact_id"], "entities": ents})
+            new_facts_data.append({"id": fact_id, "entities": ents})
 
     if not new_facts_data:
         logger.info(
@@ -112,60 +215,117 @@ def link_related_facts(
         )
         return
 
-    all_facts_in_ledger = get_all_facts_for_analysis(
-        db_path or "axiom_ledger.db"
-    )
-
-    # Adjusted to standard logging formatting to avoid Ruff G004 warnings
-    logger.info(
-        "\033[96m[The Synthesizer] Indexing %d existing facts for cross-reference...\033[0m",
-        len(all_facts_in_ledger),
+    links_created = 0
+    # Entities parsed this pass, persisted so the next sync skips spaCy.
+    fresh_entities: dict[str, str] = {}
+    # Weighted inverted index: entity -> {fact_id: weight} for every existing
+    # fact that mentions it, so each new fact is scored only against facts
+    # it shares a term with.
+    postings: defaultdict[str, dict[str, int]] = defaultdict(dict)
+    # Only entities some new fact mentions can ever be looked up, so the
+    # index skips the rest of the ledger's vocabulary.
+    new_vocab = frozenset(
+        entity
+        for new_fact in new_facts_data
+        for entity in new_fact["entities"]
     )
 
-    links_created = 0
+    def index_fact(fact_id: str, ents: dict[str, int]) -> None:
+        for entity, weight in ents.items():
+            if entity in new_vocab:
+                postings[entity][fact_id] = weight
+
+    # Facts without stored entities are parsed in spaCy pipe batches while
+    # the ledger streams past, so decoded text never accumulates.
+    pending_ids: list[str] = []
+    pending_texts: list[str] = []
+
+    def flush_pending() -> None:
+        for fact_id, existing_ents in zip(
+            pending_ids,
+            get_weighted_entities_batch(pending_texts),
+            strict=True,
+        ):
+            fresh_entities[fact_id] = json.dumps(
+                existing_ents, separators=(",", ":")
+            )
+            index_fact(fact_id, existing_ents)
+        pending_ids.clear()
+        pending_texts.clear()
 
-    for existing_fact in all_facts_in_ledger:
-        raw = existing_fact["fact_content"]
-        try:
-            content = (
-                zlib.decompress(raw).decode("utf-8")
-                if isinstance(raw, bytes)
-                else raw
+    scanned = 0
+    for fact_id, raw_content, stored in iter_facts_for_analysis(
+        db_path or "axiom_ledger.db"
+    ):
+        scanned += 1
+        existing_ents = None
+        if stored is not None:
+            with contextlib.suppress(ValueError):
+                existing_ents = json.loads(stored)
+        if existing_ents is None and fact_id in new_ents_by_id:
+            existing_ents = new_ents_by_id[fact_id]
+            fresh_entities[fact_id] = json.dumps(
+                existing_ents, separators=(",", ":")
             )
-        except (zlib.error, AttributeError):
+        if existing_ents is None:
+            try:
+                content = decompress_fact_content(raw_content)
+            except (zlib.error, ValueError):
+                continue
+            pending_ids.append(fact_id)
+            pending_texts.append(content)
+            if len(pending_texts) >= ENTITY_PIPE_FLUSH_SIZE:
+                flush_pending()
             continue
+        index_fact(fact_id, existing_ents)
+    flush_pending()
 
-        existing_ents = get_weighted_entities(content)
-
-        if not existing_ents:
-            continue
+    # Adjusted to standard logging formatting to avoid Ruff G004 warnings
+    logger.info(
+        "\033[96m[The Synthesizer] Indexed %d existing facts for cross-reference...\033[0m",
+        scanned,
+    )
 
-        for new_fact in new_facts_data:
-            if new_fact["id"] == existing_fact["fact_id"]:
+    relationships: list[tuple[str, str, float]] = []
+    synapse_pairs: list[tuple[str, str]] = []
+    for new_fact in new_facts_data:
+        # Sparse dot product over the postings of this fact's entities; the
+        # inner loop only accumulates averaged weights per candidate.
+        new_ents = new_fact["entities"]
+        scores: defaultdict[str, float] = defaultdict(float)
+        for entity, weight in new_ents.items():
+            posting = postings.get(entity)
+            if not posting:
                 continue
+            for fact_id, existing_weight in posting.items():
+                scores[fact_id] += (weight + existing_weight) / 2
 
-            # Typed as float to match division below
-            total_score = 0.0
-            shared_terms: list[str] = []
-
-            for entity, weight in new_fact["entities"].items():
-                if entity in existing_ents:
-                    avg_weight = (weight + existing_ents[entity]) / 2
-                    total_score += avg_weight
-                    shared_terms.append(entity)
-
-            if total_score >= 2:
-                insert_relationship(
-                    new_fact["id"],
-                    existing_fact["fact_id"],
-                    int(total_score),
-                )
-                links_created += 1
-
-                if len(shared_terms) > 1:
-                    for i, term1 in enumerate(shared_terms):
-                        for term2 in shared_terms[i + 1 :]:
-                            update_synapse(term1, term2, "conceptual_bridge")
+        for fact_id, total_score in scores.items():
+            if total_score < 2 or fact_id == new_fact["id"]:
+                continue
+            relationships.append((new_fact["id"], fact_id, int(total_score)))
+            links_created += 1
+
+            # Shared terms (in entity order) are only recovered for the
+            # candidates that cleared the threshold.
+            shared_terms = [
+                entity
+                for entity in new_ents
+                if fact_id in postings.get(entity, ())
+            ]
+            if len(shared_terms) > 1:
+                for i, term1 in enumerate(shared_terms):
+                    for term2 in shared_terms[i + 1 :]:
+                        synapse_pairs.append((term1, term2))
+
+    # Links and synapse bumps are written together in one transaction.
+    insert_fact_links(
+        relationships,
+        synapse_pairs,
+        "conceptual_bridge",
+        db_path or "axiom_ledger.db",
+    )
+    store_fact_entities(fresh_entities, db_path or "axiom_ledger.db")
 
     if links_created > 0:
         logger.info(
@@ -16,29 +16,37 @@ def compute_health_snapshot(db_path: str) -> dict[str, Any]:
     try:
         cur = conn.cursor()
 
-        # Fact counts by status and basic stats.
-        cur.execute("SELECT status, COUNT(*) as c FROM facts GROUP BY status")
-        status_counts = {row["status"]: row["c"] for row in cur.fetchall()}
-
-        cur.execute("SELECT COUNT(*) as c FROM facts")
-        total_facts = cur.fetchone()["c"]
-
-        cur.execute("SELECT AVG(trust_score) as avg_trust FROM facts")
-        avg_trust_row = cur.fetchone()
-        avg_trust = avg_trust_row["avg_trust"] if avg_trust_row else None
-
+        # One pass over idx_facts_status_trust_ts answers every fact
+        # aggregate: per-status partials are folded into totals below.
         cur.execute(
-            "SELECT MIN(ingest_timestamp_utc) as oldest, MAX(ingest_timestamp_utc) as newest FROM facts"
+            """
+            SELECT status,
+                   COUNT(*) AS c,
+                   SUM(trust_score) AS trust_sum,
+                   COUNT(trust_score) AS trust_n,
+                   MIN(ingest_timestamp_utc) AS oldest,
+                   MAX(ingest_timestamp_utc) AS newest
+            FROM facts
+            GROUP BY status
+            """
         )
-        age_row = cur.fetchone()
+        rows = cur.fetchall()
+        status_counts = {row["status"]: row["c"] for row in rows}
+        total_facts = sum(row["c"] for row in rows)
+        trust_n = sum(row["trust_n"] for row in rows)
+        avg_trust = (
+            sum(row["trust_sum"] or 0 for row in rows) / trust_n
+            if trust_n
+            else None
+        )
+        oldest = [row["oldest"] for row in rows if row["oldest"] is not None]
+        newest = [row["newest"] for row in rows if row["newest"] is not None]
 
         # Block / chain stats.
-        cur.execute("SELECT COUNT(*) as c FROM blocks")
-        total_blocks = cur.fetchone()["c"]
-
-        cur.execute("SELECT MAX(height) as h FROM blocks")
-        head_row = cur.fetchone()
-        chain_height = head_row["h"] if head_row else None
+        cur.execute("SELECT COUNT(*) AS c, MAX(height) AS h FROM blocks")
+        block_row = cur.fetchone()
+        total_blocks = block_row["c"]
+        chain_height = block_row["h"]
 
         snapshot = {
             "total_facts": int(total_facts or 0),
@@ -46,8 +54,8 @@ def compute_health_snapshot(db_path: str) -> dict[str, Any]:
             "avg_trust_score": float(avg_trust)
             if avg_trust is not None
             else None,
-            "oldest_fact_ts": age_row["oldest"] if age_row else None,
-            "newest_fact_ts": age_row["newest"] if age_row else None,
+            "oldest_fact_ts": min(oldest) if oldest else None,
+            "newest_fact_ts": max(newest) if newest else None,
             "total_blocks": int(total_blocks or 0),
             "chain_height": int(chain_height or 0),
         }
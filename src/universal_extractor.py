@@ -1,13 +1,21 @@
 """Contain and configure utility functions for extracting content from various sources."""
 
+import functools
 import logging
+import re
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
+from html import unescape
 from typing import Any
 
-import feedparser
 import requests
 import trafilatura
-from bs4 import BeautifulSoup
+from lxml import etree, html as lxml_html
+
+from src import feed_hub
+from src.ledger import known_source_urls
 
 logger = logging.getLogger(__name__)
 
@@ -27,26 +35,47 @@ RSS_SOURCES = [
 ]
 
 
+# Boilerplate phrases that disqualify a paragraph, matched in one C-level
+# scan without lowercasing a copy of the text.
+_GARBAGE_RE = re.compile(
+    r"read more|subscribe|cookie|javascript|click here|follow us",
+    re.IGNORECASE,
+)
+
+
+# Summaries and boilerplate lines recur verbatim across feeds and cycles,
+# so the verdict is memoized on the string itself.
+@functools.lru_cache(maxsize=8192)
+def _is_valid_sentence(text: str) -> bool:
+    """Check the structure of an already-stripped sentence."""
+    if len(text) < 45 or len(text) > 500:
+        return False
+    if _GARBAGE_RE.search(text):
+        return False
+    return text[0].isupper() and text[-1] in '.!?"'
+
+
+@functools.lru_cache(maxsize=256)
+def _topic_pattern(topic: str) -> re.Pattern[str]:
+    """Match the whole topic or any of its longer words, case-insensitively.
+
+    One alternation means a single scan per text and no lowercased copies.
+    """
+    topic_lower = topic.lower()
+    keywords = {
+        topic_lower,
+        *(w for w in topic_lower.split() if len(w) > 3),
+    }
+    return re.compile("|".join(re.escape(w) for w in keywords), re.IGNORECASE)
+
+
 class ContentSanitizer:
     """Define the class for cleanup."""
 
     @staticmethod
     def is_valid_sentence(text: str) -> bool:
         """Check the sentence structure."""
-        text = text.strip()
-        if len(text) < 45 or len(text) > 500:
-            return False
-        garbage = [
-            "read more",
-            "subscribe",
-            "cookie",
-            "javascript",
-            "click here",
-            "follow us",
-        ]
-        if any(g in text.lower() for g in garbage):
-            return False
-        return text[0].isupper() and text[-1] in '.!?"'
+        return _is_valid_sentence(text.strip())
 
     @staticmethod
     def clean_text_block(raw_text: str | None, topic: str) -> str:
@@ -54,76 +83,217 @@ class ContentSanitizer:
         if not raw_text:
             return ""
         clean_paragraphs = []
-        topic_lower = topic.lower()
-        topic_parts = topic_lower.split()
+        topic_re = _topic_pattern(topic)
         paragraphs = raw_text.split("\n")
 
         for p in paragraphs:
             p = p.strip()
-            if not ContentSanitizer.is_valid_sentence(p):
+            if not _is_valid_sentence(p):
                 continue
 
-            if topic_lower in p.lower() or any(
-                w in p.lower() for w in topic_parts if len(w) > 3
-            ):
+            if topic_re.search(p):
                 clean_paragraphs.append(p)
 
         return "\n\n".join(clean_paragraphs)
 
 
-def _manual_bs4_extraction(html: str) -> str:
-    """Fallback to the extractor using BeautifulSoup.
+# Shared so article downloads reuse keep-alive connections across calls.
+# Article fetches run max_sources at a time, well inside requests' default
+# pool of 10 per host, so the default adapter is kept.
+_SESSION = requests.Session()
+_SESSION.headers.update(
+    {
+        "User-Agent": (
+            "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) "
+            "AppleWebKit/537.36 (KHTML, like Gecko) Chrome/121.0.0.0 Safari/537.36"
+        ),
+        "Referer": "https://www.google.com/",
+    }
+)
+
+
+def _parse_html(html: str) -> Any:
+    """Parse an HTML document with lxml, or None if it is empty/unparsable."""
+    try:
+        return lxml_html.fromstring(html)
+    except ValueError:
+        # lxml rejects str input carrying an XML encoding declaration.
+        try:
+            return lxml_html.fromstring(html.encode("utf-8"))
+        except (etree.ParserError, ValueError):
+            return None
+    except etree.ParserError:
+        return None
+
+
+def _manual_html_extraction(html: str) -> str:
+    """Fallback to the extractor using lxml.
 
     Use if Trafilatura fails (common in standalone builds).
     """
-    soup = BeautifulSoup(html, "html.parser")
-    for script in soup(["script", "style", "nav", "footer", "header"]):
-        script.decompose()
+    root = _parse_html(html)
+    if root is None:
+        return ""
+    etree.strip_elements(
+        root, "script", "style", "nav", "footer", "header", with_tail=False
+    )
+    return "\n".join(p.text_content() for p in root.iter("p"))
 
-    paragraphs = [p.get_text() for p in soup.find_all("p")]
-    return "\n".join(paragraphs)
 
+# RSS summaries are plain text or a few simple tags; past this many tags
+# the fragment gets a real parse.
+FAST_SUMMARY_MAX_TAGS = 16
+_TAG_RE = re.compile(r"<[^>]+>")
 
-def _fetch_article_text(url: str, timeout: int = 12) -> str | None:
-    """Fetch article text with a robust fallback for standalone builds."""
+
+def _fast_summary_text(summary: str) -> str:
+    """Strip markup from an RSS summary, parsing only when it is tag-heavy."""
+    if summary.count("<") > FAST_SUMMARY_MAX_TAGS:
+        return _html_to_text(summary)
+    return unescape(_TAG_RE.sub("", summary))
+
+
+def _html_to_text(fragment: str) -> str:
+    """Strip markup from a short HTML fragment such as an RSS summary."""
     try:
-        headers = {
-            "User-Agent": (
-                "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) "
-                "AppleWebKit/537.36 (KHTML, like Gecko) Chrome/121.0.0.0 Safari/537.36"
-            ),
-            "Referer": "https://www.google.com/",
-        }
-
-        resp = requests.get(
-            url,
-            timeout=timeout,
-            headers=headers,
-            allow_redirects=True,
+        return lxml_html.fragment_fromstring(
+            fragment, create_parent="div"
+        ).text_content()
+    except (etree.ParserError, ValueError):
+        return fragment
+
+
+# Pages smaller than this are paywall / redirect stubs; trafilatura's
+# XPath-heavy pass never gets 200 characters out of them.
+MIN_TRAFILATURA_HTML = 2048
+# URLs whose article yielded (almost) nothing, skipped on later cycles.
+BAD_URL_CACHE_SIZE = 4096
+MIN_ARTICLE_TEXT = 100
+_BAD_URLS: OrderedDict[str, None] = OrderedDict()
+_BAD_URLS_LOCK = threading.Lock()
+
+
+def _is_bad_url(url: str) -> bool:
+    """Return True if the URL previously yielded no usable text."""
+    with _BAD_URLS_LOCK:
+        return url in _BAD_URLS
+
+
+def _mark_bad_url(url: str) -> None:
+    """Remember a URL that yielded no usable text, evicting the oldest."""
+    with _BAD_URLS_LOCK:
+        _BAD_URLS[url] = None
+        _BAD_URLS.move_to_end(url)
+        if len(_BAD_URLS) > BAD_URL_CACHE_SIZE:
+            _BAD_URLS.popitem(last=False)
+
+
+def _probe_trafilatura() -> bool:
+    """Return False if trafilatura raises on every call.
+
+    Standalone (PyInstaller) builds can ship without its settings file, and
+    extract() then fails on each article; probing once spares the per-URL
+    exception.
+    """
+    try:
+        trafilatura.extract("<html><body><p>probe</p></body></html>")
+    except Exception as e:
+        logger.debug("Trafilatura unavailable, using lxml fallback: %s", e)
+        return False
+    return True
+
+
+_TRAFILATURA_WORKS = _probe_trafilatura()
+
+
+def _extract_article_text(html_content: str) -> str:
+    """Extract article text with trafilatura, falling back to lxml."""
+    if not _TRAFILATURA_WORKS or len(html_content) < MIN_TRAFILATURA_HTML:
+        return _manual_html_extraction(html_content)
+    try:
+        text = trafilatura.extract(
+            html_content,
+            include_comments=False,
+            favor_precision=True,
+            no_fallback=True,
+            deduplicate=True,
         )
-        resp.raise_for_status()
-        html_content = resp.text
+        if text and len(text) > 200:
+            return text
+    except Exception as e:
+        logger.debug("Trafilatura failed in standalone mode: %s", e)
 
-        try:
-            text = trafilatura.extract(
-                html_content,
-                include_comments=False,
-                favor_precision=True,
-            )
-            if text and len(text) > 200:
-                return text
-        except Exception as e:
-            logger.debug("Trafilatura failed in standalone mode: %s", e)
+    return _manual_html_extraction(html_content)
 
-        return _manual_bs4_extraction(html_content)
 
+def _fetch_article_text(url: str, timeout: int = 12) -> str | None:
+    """Fetch article text with a robust fallback for standalone builds."""
+    if _is_bad_url(url):
+        return None
+    try:
+        resp = _SESSION.get(url, timeout=timeout, allow_redirects=True)
+        resp.raise_for_status()
+        text = _extract_article_text(resp.text)
     except Exception as e:
         logger.debug("Fetch failed for %s: %s", url, e)
         return None
 
+    if len(text.strip()) < MIN_ARTICLE_TEXT:
+        _mark_bad_url(url)
+    return text
+
+
+def _entry_time(entry: Any) -> datetime | None:
+    if hasattr(entry, "published_parsed") and entry.published_parsed:
+        return datetime(*entry.published_parsed[:6])
+    return None
+
+
+def _build_source(
+    link: str,
+    entry_time: datetime | None,
+    summary: str,
+    full_text: str | None,
+    topic: str,
+) -> dict[str, Any] | None:
+    """Turn one fetched candidate into a source record, or None if unusable."""
+    if full_text:
+        relevant_text = ContentSanitizer.clean_text_block(full_text, topic)
+        if relevant_text and len(relevant_text) > 100:
+            logger.info(
+                "\033[92m  -> Matched + Verified: %s...\033[0m",
+                link[:60],
+            )
+            data: dict[str, Any] = {
+                "source_url": link,
+                "content": relevant_text,
+            }
+            if entry_time:
+                data["timestamp"] = entry_time
+            return data
+
+    if summary:
+        clean_summary = _fast_summary_text(summary)
+        if ContentSanitizer.is_valid_sentence(clean_summary):
+            logger.info(
+                "\033[92m  -> Matched (RSS Summary): %s...\033[0m",
+                link[:60],
+            )
+            data = {"source_url": link, "content": clean_summary}
+            if entry_time:
+                data["timestamp"] = entry_time
+            return data
+    return None
+
+
+def find_and_extract(
+    topic: str, max_sources: int = 3, db_path: str | None = None
+) -> list[dict[str, Any]]:
+    """Navigate source feed to identify extract points.
 
-def find_and_extract(topic: str, max_sources: int = 3) -> list[dict[str, Any]]:
-    """Navigate source feed to identify extract points."""
+    With `db_path`, articles the ledger already holds facts from are
+    skipped before they are downloaded.
+    """
     logger.info(
         "\033[2m--- [Pathfinder] Seeking sources for '%s'... ---\033[0m",
         topic,
@@ -132,80 +302,67 @@ def find_and_extract(topic: str, max_sources: int = 3) -> list[dict[str, Any]]:
     # Added typing here so Mypy knows what goes into this empty list
     extracted_content: list[dict[str, Any]] = []
     seen_urls: set[str] = set()
-    topic_keywords = set(topic.lower().split())
+    topic_re = _topic_pattern(topic)
 
-    for feed_url in RSS_SOURCES:
-        if len(extracted_content) >= max_sources:
-            break
+    # Feeds come from the shared hub (fetched concurrently, reused across
+    # topics and with the Zeitgeist engine); matching stays serial, in
+    # RSS_SOURCES order.
+    feeds = feed_hub.get_feeds(RSS_SOURCES)
 
+    # Matching entries, in feed order: (link, published time, summary).
+    candidates: list[tuple[str, datetime | None, str]] = []
+    for feed in feeds.values():
+        if feed is None:
+            continue
         try:
-            feed = feedparser.parse(feed_url)
             for entry in feed.entries[:15]:
-                if len(extracted_content) >= max_sources:
-                    break
-
                 link = entry.get("link")
                 if not link or link in seen_urls:
                     continue
 
                 title = entry.get("title", "")
                 summary = entry.get("summary", "")
-                combined_meta = (title + " " + summary).lower()
 
-                if topic.lower() in combined_meta or any(
-                    k in combined_meta for k in topic_keywords if len(k) > 3
-                ):
+                if topic_re.search(title + " " + summary):
                     seen_urls.add(link)
-
-                    entry_time = None
-                    if (
-                        hasattr(entry, "published_parsed")
-                        and entry.published_parsed
-                    ):
-                        entry_time = datetime(*entry.published_parsed[:6])
-
-                    full_text = _fetch_article_text(link)
-
-                    if full_text:
-                        relevant_text = ContentSanitizer.clean_text_block(
-                            full_text,
-                            topic,
-                        )
-                        if relevant_text and len(relevant_text) > 100:
-                            logger.info(
-                                "\033[92m  -> Matched + Verified: %s...\033[0m",
-                                link[:60],
-                            )
-                            data: dict[str, Any] = {
-                                "source_url": link,
-                                "content": relevant_text,
-                            }
-                            if entry_time:
-                                data["timestamp"] = entry_time
-                            extracted_content.append(data)
-                            continue
-
-                    if summary:
-                        clean_summary = BeautifulSoup(
-                            summary,
-                            "html.parser",
-                        ).get_text()
-                        if ContentSanitizer.is_valid_sentence(clean_summary):
-                            logger.info(
-                                "\033[92m  -> Matched (RSS Summary): %s...\033[0m",
-                                link[:60],
-                            )
-                            data = {
-                                "source_url": link,
-                                "content": clean_summary,
-                            }
-                            if entry_time:
-                                data["timestamp"] = entry_time
-                            extracted_content.append(data)
-
+                    candidates.append((link, _entry_time(entry), summary))
         except Exception as e:
             logger.error("An error occurred: %s", e)
             continue
 
+    # Articles already mined on earlier cycles would only re-yield facts the
+    # ledger rejects as duplicates, so they are not downloaded again.
+    if db_path and candidates:
+        known = known_source_urls([link for link, _, _ in candidates], db_path)
+        if known:
+            candidates = [c for c in candidates if c[0] not in known]
+
+    # Fetch articles in waves sized to the sources still needed: the result
+    # matches a serial walk, but each wave's downloads overlap.
+    next_idx = 0
+    with ThreadPoolExecutor(max_workers=max(1, max_sources)) as executor:
+        while len(extracted_content) < max_sources and next_idx < len(
+            candidates
+        ):
+            wave = candidates[
+                next_idx : next_idx + max_sources - len(extracted_content)
+            ]
+            next_idx += len(wave)
+            texts = executor.map(
+                _fetch_article_text, [link for link, _, _ in wave]
+            )
+            for (link, entry_time, summary), full_text in zip(
+                wave, texts, strict=True
+            ):
+                try:
+                    data = _build_source(
+                        link, entry_time, summary, full_text, topic
+                    )
+                except Exception as e:
+                    logger.error("An error occurred: %s", e)
+                    continue
+                if data is not None:
+                    extracted_content.append(data)
+
     logger.info("Success. Found %d valid sources.", len(extracted_content))
     return extracted_content
@@ -1,17 +1,23 @@
 """Configure and set parser."""
 
+import functools
 import logging
 from collections import Counter
+from itertools import chain, zip_longest
 from typing import Any
 
-import feedparser
-
+from src import feed_hub
 from src.axiom_model_loader import load_nlp_model
 
 logger = logging.getLogger(__name__)
 
 
-NLP_MODEL: Any = load_nlp_model()
+# Headlines per spaCy pipe batch, and the stages NER does not read.
+NER_BATCH_SIZE = 64
+# Headline NER stops once this many topic entities have been counted.
+MAX_TRENDING_ENTITIES = 400
+_NER_UNUSED_PIPES = ("tagger", "parser", "attribute_ruler", "lemmatizer")
+
 
 RSS_FEEDS = [
     "http://feeds.bbci.co.uk/news/rss.xml",
@@ -26,52 +32,75 @@ RSS_FEEDS = [
     "https://www.wired.com/feed/rss",
 ]
 
-IGNORED_ENTITIES = {
-    "the",
-    "a",
-    "an",
-    "today",
-    "yesterday",
-    "tomorrow",
-    "monday",
-    "tuesday",
-    "wednesday",
-    "thursday",
-    "friday",
-    "saturday",
-    "sunday",
-    "january",
-    "february",
-    "march",
-    "april",
-    "may",
-    "june",
-    "july",
-    "august",
-    "september",
-    "october",
-    "november",
-    "december",
-    "year",
-    "years",
-    "week",
-    "weeks",
-    "day",
-    "days",
-    "morning",
-    "night",
-    "new york times",
-    "bbc",
-    "reuters",
-    "cnn",
-    "npr",
-    "ap",
-    "press",
-    "associated press",
-    "bloomberg",
-    "image",
-    "photo",
-}
+# Entity labels that count as trending topics.
+_TOPIC_LABELS = frozenset(
+    {"ORG", "PERSON", "GPE", "EVENT", "WORK_OF_ART", "PRODUCT"}
+)
+
+IGNORED_ENTITIES: frozenset[str] = frozenset(
+    {
+        "the",
+        "a",
+        "an",
+        "today",
+        "yesterday",
+        "tomorrow",
+        "monday",
+        "tuesday",
+        "wednesday",
+        "thursday",
+        "friday",
+        "saturday",
+        "sunday",
+        "january",
+        "february",
+        "march",
+        "april",
+        "may",
+        "june",
+        "july",
+        "august",
+        "september",
+        "october",
+        "november",
+        "december",
+        "year",
+        "years",
+        "week",
+        "weeks",
+        "day",
+        "days",
+        "morning",
+        "night",
+        "new york times",
+        "bbc",
+        "reuters",
+        "cnn",
+        "npr",
+        "ap",
+        "press",
+        "associated press",
+        "bloomberg",
+        "image",
+        "photo",
+    }
+)
+
+
+@functools.cache
+def _nlp() -> Any:
+    """Load this module's spaCy model on first use.
+
+    The copy only ever runs NER, so the other stages are switched off once
+    at load instead of on every pipe call.
+    """
+    model = load_nlp_model()
+    model.select_pipes(
+        disable=[
+            name for name in _NER_UNUSED_PIPES if name in model.pipe_names
+        ]
+    )
+    return model
 
 
 def get_trending_topics(top_n: int = 100) -> list[str]:
@@ -79,7 +108,11 @@ def get_trending_topics(top_n: int = 100) -> list[str]:
 
     Filter out noise to find substantial subjects.
     """
-    all_entities: list[str] = []
+    # Entities are counted case-folded; display_name keeps the first
+    # spelling seen for each.
+    topic_counts: Counter[str] = Counter()
+    display_name: dict[str, str] = {}
+    entity_count = 0
 
     default_watch_list = [
         "Artificial Intelligence",
@@ -91,44 +124,21 @@ def get_trending_topics(top_n: int = 100) -> list[str]:
         "Global Conflict",
     ]
 
-    for feed_url in RSS_FEEDS:
+    # Feeds come from the shared hub; NER runs afterwards on this thread.
+    feeds = feed_hub.get_feeds(RSS_FEEDS)
+
+    per_feed: list[list[str]] = []
+    for feed_url, feed in feeds.items():
         try:
-            feed = feedparser.parse(feed_url)
-            if feed.bozo:
+            if feed is None or feed.bozo:
                 continue
-
-            for entry in feed.entries[:20]:
-                title = entry.get("title", "")
-                if not title:
-                    continue
-
-                doc = NLP_MODEL(title)
-
-                for ent in doc.ents:
-                    text = ent.text.strip()
-                    lower_text = text.lower()
-
-                    if ent.label_ not in (
-                        "ORG",
-                        "PERSON",
-                        "GPE",
-                        "EVENT",
-                        "WORK_OF_ART",
-                        "PRODUCT",
-                    ):
-                        continue
-
-                    if lower_text in IGNORED_ENTITIES:
-                        continue
-                    if len(text) < 3:
-                        continue
-                    if text.isdigit():
-                        continue
-
-                    text = text.removesuffix("'s")
-
-                    all_entities.append(text)
-
+            per_feed.append(
+                [
+                    title
+                    for entry in feed.entries[:20]
+                    if (title := entry.get("title", ""))
+                ]
+            )
         except Exception as e:
             # Using %s instead of f-strings in logging satisfies Ruff's G004 rule.
             logger.debug(
@@ -136,24 +146,59 @@ def get_trending_topics(top_n: int = 100) -> list[str]:
             )
             continue
 
-    if not all_entities:
+    # Headlines are interleaved rank by rank across feeds, so stopping early
+    # drops the least prominent stories rather than whole feeds. A story
+    # syndicated verbatim across feeds goes through NER only once.
+    titles: list[str] = []
+    seen_titles: set[str] = set()
+    for title in chain.from_iterable(zip_longest(*per_feed)):
+        if title is None:
+            continue
+        key = title.strip().lower()
+        if key in seen_titles:
+            continue
+        seen_titles.add(key)
+        titles.append(title)
+
+    # One batched NER pass over the headlines, consumed lazily so no further
+    # batches run once enough entities have been counted.
+    nlp = _nlp()
+    try:
+        for doc in nlp.pipe(titles, batch_size=NER_BATCH_SIZE):
+            for ent in doc.ents:
+                if ent.label_ not in _TOPIC_LABELS:
+                    continue
+
+                # One guard, cheapest test first: the lowercased lookup only
+                # runs for entities that pass the length and digit checks.
+                text = ent.text.strip()
+                if (
+                    len(text) < 3
+                    or text.isdigit()
+                    or text.lower() in IGNORED_ENTITIES
+                ):
+                    continue
+
+                text = text.removesuffix("'s")
+
+                key = text.lower()
+                topic_counts[key] += 1
+                display_name.setdefault(key, text)
+                entity_count += 1
+            if entity_count >= MAX_TRENDING_ENTITIES:
+                break
+    except Exception as e:
+        logger.debug("[Zeitgeist] Headline NER failed: %s", e)
+
+    if not topic_counts:
         logger.info(
             "[Zeitgeist] No substantial topics found via NER. Defaulting to standard watch list.",
         )
         return default_watch_list[:top_n]
 
-    topic_counts = Counter(all_entities)
-
-    common = topic_counts.most_common(15)
-
-    final_topics = [t[0] for t in common]
-
-    seen = set()
-    unique_topics: list[str] = []
-    for t in final_topics:
-        if t.lower() not in seen:
-            unique_topics.append(t)
-            seen.add(t.lower())
+    unique_topics = [
+        display_name[key] for key, _ in topic_counts.most_common(15)
+    ]
 
     result = unique_topics[:top_n]
 
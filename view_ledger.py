@@ -3,9 +3,14 @@
 import argparse
 import os
 import sqlite3
+import sys
 import zlib
 
-from src.ledger import initialize_database
+from src.ledger import (
+    decompress_fact_content,
+    initialize_database,
+    open_connection,
+)
 
 CYAN = "\033[96m"
 GREEN = "\033[92m"
@@ -14,51 +19,69 @@ PINK = "\033[95m"
 GRAY = "\033[90m"
 RESET = "\033[0m"
 
+# Read-only inspection pages the ledger through a memory map.
+MMAP_SIZE = 256 * 1024 * 1024
+
 
 def print_header(text):
     """Show the header for this log stream."""
     print(f"\n{CYAN}=== {text} ==={RESET}")
 
 
+def _open(db_path: str) -> sqlite3.Connection:
+    """Open the ledger with the shared pragmas plus a memory map for reads."""
+    conn = open_connection(db_path)
+    conn.execute(f"PRAGMA mmap_size={MMAP_SIZE}")
+    return conn
+
+
 def ensure_ledger_schema(db_path: str) -> None:
-    """Initialize schema for empty or missing."""
-    conn = sqlite3.connect(db_path)
-    cur = conn.cursor()
-    try:
-        cur.execute(
-            "SELECT name FROM sqlite_master WHERE type='table' AND name='facts'"
-        )
-        needs_init = cur.fetchone() is None
-    finally:
-        conn.close()
-    if needs_init:
-        initialize_database(db_path)
+    """Create or migrate the ledger schema before inspecting it.
+
+    initialize_database is idempotent and also adds the columns and indexes
+    older ledgers lack, which print_stats and print_facts select by name.
+    """
+    initialize_database(db_path)
 
 
 def print_stats(db_path: str):
     """Show stats as status from synapses and lexicon."""
-    conn = sqlite3.connect(db_path)
+    conn = _open(db_path)
     cur = conn.cursor()
 
     try:
-        cur.execute("SELECT status, COUNT(*) FROM facts GROUP BY status")
-        stats = cur.fetchall()
-        cur.execute("SELECT COUNT(*) FROM facts")
-        total_facts = cur.fetchone()[0]
-
-        try:
-            cur.execute("SELECT COUNT(*) FROM fact_relationships")
-            rels = cur.fetchone()[0]
-        except sqlite3.Error:
-            rels = 0
+        # One scan of facts yields both breakdowns and the total.
+        cur.execute(
+            "SELECT status, fragment_state, COUNT(*) FROM facts "
+            "GROUP BY status, fragment_state"
+        )
+        status_counts = {"trusted": 0, "disputed": 0, "uncorroborated": 0}
+        frag_counts = {
+            "unknown": 0,
+            "suspected_fragment": 0,
+            "confirmed_fragment": 0,
+            "rejected_fragment": 0,
+        }
+        total_facts = 0
+        for status, state, count in cur.fetchall():
+            total_facts += count
+            if status in status_counts:
+                status_counts[status] += count
+            if state in frag_counts:
+                frag_counts[state] += count
 
+        # The mesh tables are counted in a single round trip.
         try:
-            cur.execute("SELECT COUNT(*) FROM lexicon")
-            atoms = cur.fetchone()[0]
-            cur.execute("SELECT COUNT(*) FROM synapses")
-            synapses = cur.fetchone()[0]
-        except Exception as e:
-            atoms, synapses = 0, 0
+            cur.execute(
+                """
+                SELECT (SELECT COUNT(*) FROM fact_relationships),
+                       (SELECT COUNT(*) FROM lexicon),
+                       (SELECT COUNT(*) FROM synapses)
+                """
+            )
+            rels, atoms, synapses = cur.fetchone()
+        except sqlite3.Error as e:
+            rels, atoms, synapses = 0, 0, 0
             print(f"Error: {e}")
 
         print_header("LEDGER & MESH STATISTICS")
@@ -68,10 +91,6 @@ def print_stats(db_path: str):
         print(f"Neural Synapses:    {synapses}")
         print("-" * 30)
 
-        status_counts = {"trusted": 0, "disputed": 0, "uncorroborated": 0}
-        for status, count in stats:
-            if status in status_counts:
-                status_counts[status] = count
         for status in ("trusted", "disputed", "uncorroborated"):
             count = status_counts[status]
             label = "trusted (verified)" if status == "trusted" else status
@@ -82,30 +101,14 @@ def print_stats(db_path: str):
             )
             print(f"{color}{label.ljust(20)}: {count}{RESET}")
 
-        try:
-            cur.execute(
-                "SELECT fragment_state, COUNT(*) FROM facts GROUP BY fragment_state"
+        if total_facts:
+            print()
+            print(
+                f"{PINK}{'fragments (suspect)'.ljust(20)}: {frag_counts['suspected_fragment']}{RESET}"
+            )
+            print(
+                f"{PINK}{'fragments (confirmed)'.ljust(20)}: {frag_counts['confirmed_fragment']}{RESET}"
             )
-            frag_rows = cur.fetchall()
-            if frag_rows:
-                frag_counts = {
-                    "unknown": 0,
-                    "suspected_fragment": 0,
-                    "confirmed_fragment": 0,
-                    "rejected_fragment": 0,
-                }
-                for state, count in frag_rows:
-                    if state in frag_counts:
-                        frag_counts[state] = count
-                print()
-                print(
-                    f"{PINK}{'fragments (suspect)'.ljust(20)}: {frag_counts['suspected_fragment']}{RESET}"
-                )
-                print(
-                    f"{PINK}{'fragments (confirmed)'.ljust(20)}: {frag_counts['confirmed_fragment']}{RESET}"
-                )
-        except Exception as e:
-            print(f"Error: {e}")
 
     except Exception as e:
         print(f"Error reading stats: {e}")
@@ -115,7 +118,7 @@ def print_stats(db_path: str):
 
 def print_brain(db_path: str, limit=15):
     """Specify and display db_path of brain for nodes and peers."""
-    conn = sqlite3.connect(db_path)
+    conn = _open(db_path)
     conn.row_factory = sqlite3.Row
     cur = conn.cursor()
 
@@ -157,20 +160,31 @@ def print_brain(db_path: str, limit=15):
         conn.close()
 
 
-def print_facts(db_path: str, limit=20):
-    """Process facts to print as decompressed content."""
-    conn = sqlite3.connect(db_path)
+def print_facts(db_path: str, limit=20, show_content=True):
+    """Process facts to print as decompressed content.
+
+    With show_content=False the fact text is never read or decompressed;
+    integrity comes from the stored fragment columns alone.
+    """
+    conn = _open(db_path)
     conn.row_factory = sqlite3.Row
     cur = conn.cursor()
 
     print_header(f"RECENT RECORDS (Limit: {limit})")
 
-    cur.execute(
-        "SELECT * FROM facts ORDER BY ingest_timestamp_utc DESC LIMIT ?",
+    # Only the printed columns, paged from the cursor one row at a time so
+    # a large --limit never holds every compressed BLOB at once.
+    content_col = "fact_content" if show_content else "NULL AS fact_content"
+    rows = cur.execute(
+        f"""
+        SELECT fact_id, status, trust_score, {content_col}, source_url,
+               lexically_processed, fragment_state, fragment_score
+        FROM facts ORDER BY ingest_timestamp_utc DESC LIMIT ?
+        """,  # noqa: S608
         (limit,),
     )
-    rows = cur.fetchall()
 
+    write = sys.stdout.write
     for row in rows:
         r = dict(row)
 
@@ -181,40 +195,45 @@ def print_facts(db_path: str, limit=20):
             else (RED if status == "disputed" else GRAY)
         )
 
-        try:
-            fact_content = zlib.decompress(r["fact_content"]).decode("utf-8")
-        except (TypeError, zlib.error):
-            fact_content = f"ERROR: Could not decompress fact content (ID: {r['fact_id'][:8]})."
-
         processed = (
             f"{PINK}◈{RESET}"
             if r.get("lexically_processed")
             else f"{GRAY}◇{RESET}"
         )
 
-        word_count = len(fact_content.split())
         frag_state = r.get("fragment_state", "unknown")
         frag_score = r.get("fragment_score", 0.0) or 0.0
 
+        if show_content:
+            try:
+                fact_content = decompress_fact_content(r["fact_content"])
+            except (TypeError, ValueError, zlib.error):
+                fact_content = f"ERROR: Could not decompress fact content (ID: {r['fact_id'][:8]})."
+            word_count = len(fact_content.split())
+            words = str(word_count)
+        else:
+            word_count = None
+            words = "-"
+
         if frag_state == "confirmed_fragment":
             integrity = f"{RED}FRAGMENT!{RESET}"
-        elif frag_state == "suspected_fragment" or frag_score >= 0.5:
+        elif (
+            frag_state == "suspected_fragment"
+            or frag_score >= 0.5
+            or (word_count is not None and word_count <= 8)
+        ):
             integrity = f"{RED}FRAGMENT?{RESET}"
         else:
-            integrity = (
-                f"{GREEN}COMPLETE{RESET}"
-                if word_count > 8
-                else f"{RED}FRAGMENT?{RESET}"
-            )
+            integrity = f"{GREEN}COMPLETE{RESET}"
 
-        print(
-            f"{color}[{status.upper()}]{RESET} {processed} Trust: {r['trust_score']} | Words: {word_count} | {integrity}"
-        )
-        print(f"   {fact_content}")
-        print(f"   {GRAY}Source: {r['source_url']}{RESET}")
-        print()
+        line = f"{color}[{status.upper()}]{RESET} {processed} Trust: {r['trust_score']} | Words: {words} | {integrity}\n"
+        if show_content:
+            line += f"   {fact_content}\n"
+        # One write per record instead of four print calls.
+        write(line + f"   {GRAY}Source: {r['source_url']}{RESET}\n\n")
 
     conn.close()
+    sys.stdout.flush()
 
 
 if __name__ == "__main__":
@@ -237,6 +256,11 @@ if __name__ == "__main__":
         default=10,
         help="Number of items to show",
     )
+    parser.add_argument(
+        "--no-content",
+        action="store_true",
+        help="List facts without decompressing and printing their text",
+    )
     parser.add_argument(
         "--db",
         type=str,
@@ -255,4 +279,4 @@ if __name__ == "__main__":
         print_brain(args.db, args.limit)
     else:
         print_stats(args.db)
-        print_facts(args.db, args.limit)
+        print_facts(args.db, args.limit, show_content=not args.no_content)
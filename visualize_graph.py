@@ -1,29 +1,50 @@
 """Provide functions for visualizing graph data."""
 
 import argparse
+import heapq
 import json
+import re
 
 DB_NAME = "axiom_ledger.db"
 
+# Node fill per fact status; lexical-mesh atoms share one color.
+_COLOR_TABLE = {"trusted": "#22c55e", "disputed": "#ff0055"}
+_DEFAULT_COLOR = "#00f0ff"
+_BRAIN_COLOR = "#ff00ff"
 
-def get_node_colors(status, is_brain):
-    """Return raw hex colors for the JS Canvas Renderer."""
-    if is_brain:
-        return "#ff00ff"
-    if status == "trusted":
-        return "#22c55e"
-    if status == "disputed":
-        return "#ff0055"
-    return "#00f0ff"
+# Above this many nodes the physics solver uses a coarser Barnes-Hut theta.
+BARNES_HUT_FINE_MAX_NODES = 500
+# Edges kept (strongest first) in the generated page.
+MAX_RENDERED_EDGES = 800
+# Largest graph laid out in Python (the dense spring layout is O(N^2)).
+LAYOUT_PRECOMPUTE_MAX_NODES = 2000
 
+# Spots in pyvis's page that inject_sota_engine rewrites in one pass.
+_INJECTION_POINTS = re.compile(r"background-color: #ffffff;|</head>|</body>")
+# Where the node payload is streamed into the engine script.
+_NODE_DATA_SLOT = "/*AXIOM_NODE_DATA*/"
 
-def inject_sota_engine(filepath, total_nodes, node_data_json, mode_label):
-    """Inject the 3D Math, Plasma Engine, and SOTA HUD Modal into the specific file."""
-    with open(filepath, encoding="utf-8") as file:
-        html = file.read()
-
-    html = html.replace("background-color: #ffffff;", "")
 
+def get_node_colors(status, is_brain):
+    """Return raw hex colors for the JS Canvas Renderer."""
+    if is_brain:
+        return _BRAIN_COLOR
+    return _COLOR_TABLE.get(status, _DEFAULT_COLOR)
+
+
+def inject_sota_engine(
+    filepath,
+    html,
+    total_nodes,
+    node_data,
+    mode_label,
+    layout_precomputed=False,
+):
+    """Write pyvis's html to filepath with the Plasma Engine and SOTA HUD injected.
+
+    The page is written chunk by chunk and node_data is serialized straight
+    into the file, so the finished HTML never exists as one Python string.
+    """
     cyberpunk_css = """
     <style>
         html, body {
@@ -67,7 +88,6 @@ def inject_sota_engine(filepath, total_nodes, node_data_json, mode_label):
     </style>
     </head>
     """
-    html = html.replace("</head>", cyberpunk_css)
 
     engine_js = f"""
     <div id="hud">
@@ -86,13 +106,41 @@ def inject_sota_engine(filepath, total_nodes, node_data_json, mode_label):
     </div>
 
     <script>
-        const axiomData = {node_data_json};
+        // Node attributes arrive as parallel arrays; idIndex maps a vis
+        // node id to its slot so the draw loops index typed arrays.
+        const axiomDataArrays = {_NODE_DATA_SLOT};
+        const nodeIds = axiomDataArrays.ids;
+        const nodeStatuses = axiomDataArrays.statuses;
+        const nodeColors = axiomDataArrays.colors;
+        const nodeContents = axiomDataArrays.contents;
+        const nodeSources = axiomDataArrays.sources;
+        const nodeValues = Float32Array.from(axiomDataArrays.values);
+        const nodeZs = Float32Array.from(axiomDataArrays.zs);
+        const isBrain = axiomDataArrays.isBrain;
+        const idIndex = new Map();
+        nodeIds.forEach((id, i) => idIndex.set(id, i));
         let physicsActive = true;
         let animationTime = 0;
+        // Idle frames are throttled to ~30 FPS; drags redraw every frame.
+        const IDLE_FRAME_MS = 33;
+        let isDragging = false;
+        let lastDraw = 0;
         const CAMERA_Z = 1000;
         let cachedPositions = null;
         let cachedEdges = null;
-        const MAX_EDGES_FOR_FANCY = 800;
+        const layoutPrecomputed = {"true" if layout_precomputed else "false"};
+        // Edge strands are sampled at most this many times, and their wobble
+        // reads a precomputed sine table instead of calling Math.sin/cos.
+        const MAX_EDGE_SEGMENTS = 24;
+        const TRIG_SIZE = 1024;
+        const TRIG = new Float32Array(TRIG_SIZE);
+        for (let t = 0; t < TRIG_SIZE; t++) TRIG[t] = Math.sin((t / TRIG_SIZE) * Math.PI * 2);
+        const TRIG_SCALE = TRIG_SIZE / (Math.PI * 2);
+        function fastSin(x) {{
+            let t = Math.round(x * TRIG_SCALE) % TRIG_SIZE;
+            return TRIG[t < 0 ? t + TRIG_SIZE : t];
+        }}
+        function fastCos(x) {{ return fastSin(x + Math.PI / 2); }}
 
         const initInterval = setInterval(() => {{
             if (typeof network !== 'undefined') {{ clearInterval(initInterval); startAxiomEngine(); }}
@@ -104,30 +152,37 @@ def inject_sota_engine(filepath, total_nodes, node_data_json, mode_label):
                 document.getElementById('hud-physics').innerText = `STABILIZING... ${{progress}}%`;
             }});
 
-            network.once("stabilizationIterationsDone", function() {{
+            function freezeLayout() {{
                 network.setOptions({{ physics: false }});
                 physicsActive = false;
                 cachedPositions = network.getPositions();
                 cachedEdges = edges.get();
-                document.getElementById('hud-physics').innerText = "FROZEN (60 FPS)";
+                document.getElementById('hud-physics').innerText = "FROZEN (30 FPS IDLE)";
                 document.getElementById('hud-physics').style.color = "#22c55e";
                 requestAnimationFrame(renderLoop);
-            }});
-            // Failsafe if stabilization is too fast
-            setTimeout(() => {{ if(physicsActive) network.emit("stabilizationIterationsDone"); }}, 2000);
+            }}
+            if (layoutPrecomputed) {{
+                // Positions were computed when the page was generated.
+                freezeLayout();
+            }} else {{
+                network.once("stabilizationIterationsDone", freezeLayout);
+                // Failsafe if stabilization is too fast
+                setTimeout(() => {{ if(physicsActive) network.emit("stabilizationIterationsDone"); }}, 2000);
+            }}
 
             // CLICK HANDLER
             network.on("click", function(params) {{
                 if (params.nodes.length > 0) {{
                     const nodeId = params.nodes[0];
-                    const data = axiomData[nodeId];
-                    if (data) {{
-                        document.getElementById('modal-title').innerText = data.is_brain ? "Linguistic Atom" : "Verified Record";
-                        document.getElementById('modal-status').innerText = `[${{data.status.toUpperCase()}}]`;
-                        document.getElementById('modal-status').style.color = data.color;
-                        document.getElementById('axiom-modal').style.borderLeftColor = data.color;
-                        document.getElementById('modal-text').innerText = data.content;
-                        let metaHtml = data.source ? `<b>SOURCE:</b><br><a href="${{data.source}}" target="_blank" style="color:#00f0ff;">${{data.source}}</a>` : `<b>STRENGTH:</b> ${{data.value}}`;
+                    const i = idIndex.get(nodeId);
+                    if (i !== undefined) {{
+                        const color = nodeColors[i], source = nodeSources[i];
+                        document.getElementById('modal-title').innerText = isBrain ? "Linguistic Atom" : "Verified Record";
+                        document.getElementById('modal-status').innerText = `[${{nodeStatuses[i].toUpperCase()}}]`;
+                        document.getElementById('modal-status').style.color = color;
+                        document.getElementById('axiom-modal').style.borderLeftColor = color;
+                        document.getElementById('modal-text').innerText = nodeContents[i];
+                        let metaHtml = source ? `<b>SOURCE:</b><br><a href="${{source}}" target="_blank" style="color:#00f0ff;">${{source}}</a>` : `<b>STRENGTH:</b> ${{nodeValues[i]}}`;
                         document.getElementById('modal-meta').innerHTML = metaHtml;
                         document.getElementById('axiom-modal').classList.add('active');
                         document.getElementById('modal-text').scrollTop = 0;
@@ -136,7 +191,9 @@ def inject_sota_engine(filepath, total_nodes, node_data_json, mode_label):
             }});
 
             // When the user drags nodes, refresh cached positions so the renderer stays in sync.
+            network.on("dragStart", function() {{ isDragging = true; }});
             network.on("dragEnd", function() {{
+                isDragging = false;
                 cachedPositions = network.getPositions();
             }});
 
@@ -144,46 +201,62 @@ def inject_sota_engine(filepath, total_nodes, node_data_json, mode_label):
                 const positions = cachedPositions || network.getPositions();
                 const edgesData = cachedEdges || edges.get();
                 ctx.globalCompositeOperation = "screen";
-                if (!physicsActive) animationTime += 0.02;
-
+                if (!physicsActive) animationTime = performance.now() * 0.0012;
+
+                // Edges are traced into one Path2D per color and stroked
+                // once per color, instead of one stroke (and one canvas
+                // state save/restore) per edge per strand.
+                const paths = new Map();
+                const pathFor = (color) => {{
+                    let path = paths.get(color);
+                    if (!path) {{ path = new Path2D(); paths.set(color, path); }}
+                    return path;
+                }};
                 const totalEdges = edgesData.length || 0;
-                const edgeStep = totalEdges > MAX_EDGES_FOR_FANCY ? Math.ceil(totalEdges / MAX_EDGES_FOR_FANCY) : 1;
-                for (let ei = 0; ei < totalEdges; ei += edgeStep) {{
+                for (let ei = 0; ei < totalEdges; ei++) {{
                     const edge = edgesData[ei];
                     let p1 = positions[edge.from], p2 = positions[edge.to];
-                    if (!p1 || !p2) return;
-                    let d1 = axiomData[edge.from], d2 = axiomData[edge.to];
+                    if (!p1 || !p2) continue;
+                    const i1 = idIndex.get(edge.from), i2 = idIndex.get(edge.to);
+                    if (i1 === undefined || i2 === undefined) continue;
+
+                    let s1 = CAMERA_Z / (CAMERA_Z + nodeZs[i1]), s2 = CAMERA_Z / (CAMERA_Z + nodeZs[i2]);
+                    let x1 = p1.x * s1, y1 = p1.y * s1;
+                    let dx = p2.x * s2 - x1, dy = p2.y * s2 - y1;
+                    let dist = Math.sqrt(dx*dx + dy*dy);
+                    if (dist === 0) continue;
+                    // Unit direction and normal replace the per-edge rotate.
+                    let ux = dx / dist, uy = dy / dist;
+                    const segments = Math.min(MAX_EDGE_SEGMENTS, Math.ceil(dist / (dist > 300 ? 12 : 6)));
+                    const step = dist / segments;
 
-                    let proj1 = {{x: p1.x * (CAMERA_Z/(CAMERA_Z+d1.z)), y: p1.y * (CAMERA_Z/(CAMERA_Z+d1.z)), s: (CAMERA_Z/(CAMERA_Z+d1.z))}};
-                    let proj2 = {{x: p2.x * (CAMERA_Z/(CAMERA_Z+d2.z)), y: p2.y * (CAMERA_Z/(CAMERA_Z+d2.z)), s: (CAMERA_Z/(CAMERA_Z+d2.z))}};
-                    let dx = proj2.x - proj1.x, dy = proj2.y - proj1.y;
-                    let dist = Math.sqrt(dx*dx + dy*dy), angle = Math.atan2(dy, dx);
-
-                    ctx.save();
-                    ctx.translate(proj1.x, proj1.y); ctx.rotate(angle);
                     for (let w = 1; w <= 2; w++) {{
-                        ctx.beginPath(); ctx.strokeStyle = (w === 1) ? d1.color : d2.color;
-                        ctx.lineWidth = 1.0; ctx.shadowBlur = 10; ctx.shadowColor = ctx.strokeStyle;
-                        ctx.globalAlpha = 0.7;
-                        const segmentStep = dist > 300 ? 12 : 6;
-                        for (let i = 0; i <= dist; i += segmentStep) {{
-                            let env = Math.sin((i / dist) * Math.PI);
-                            let off = (Math.sin(i * 0.03 * w + animationTime) + Math.cos(i * 0.06 - animationTime * 1.3)) * 6 * env;
-                            if (i === 0) ctx.moveTo(i, off); else ctx.lineTo(i, off);
+                        const path = pathFor(nodeColors[(w === 1) ? i1 : i2]);
+                        for (let k = 0; k <= segments; k++) {{
+                            let i = k * step;
+                            let env = fastSin((k / segments) * Math.PI);
+                            let off = (fastSin(i * 0.03 * w + animationTime) + fastCos(i * 0.06 - animationTime * 1.3)) * 6 * env;
+                            let px = x1 + i * ux - off * uy, py = y1 + i * uy + off * ux;
+                            if (k === 0) path.moveTo(px, py); else path.lineTo(px, py);
                         }}
-                        ctx.stroke();
                     }}
-                    ctx.restore();
                 }}
+                ctx.save();
+                ctx.lineWidth = 1.0; ctx.shadowBlur = 10; ctx.globalAlpha = 0.7;
+                for (const [color, path] of paths) {{
+                    ctx.strokeStyle = color; ctx.shadowColor = color;
+                    ctx.stroke(path);
+                }}
+                ctx.restore();
 
                 ctx.globalCompositeOperation = "source-over";
-                for (let nodeId in positions) {{
-                    let pos = positions[nodeId], data = axiomData[nodeId];
-                    if (!data) continue;
-                    let s_ = CAMERA_Z / (CAMERA_Z + data.z);
+                for (let i = 0; i < nodeIds.length; i++) {{
+                    let pos = positions[nodeIds[i]];
+                    if (!pos) continue;
+                    let s_ = CAMERA_Z / (CAMERA_Z + nodeZs[i]);
                     let proj = {{x: pos.x * s_, y: pos.y * s_, s: s_}};
-                    let size = (Math.min(data.value * 3 + 10, 40)) * proj.s;
-                    ctx.fillStyle = data.color; ctx.shadowColor = data.color; ctx.shadowBlur = 20 * proj.s;
+                    let size = (Math.min(nodeValues[i] * 3 + 10, 40)) * proj.s;
+                    ctx.fillStyle = nodeColors[i]; ctx.shadowColor = nodeColors[i]; ctx.shadowBlur = 20 * proj.s;
                     ctx.fillRect(proj.x - size/2, proj.y - size/2, size, size);
                     ctx.fillStyle = "#ffffff"; ctx.shadowBlur = 0;
                     ctx.fillRect(proj.x - size/4, proj.y - size/4, size/2, size/2);
@@ -191,13 +264,61 @@ def inject_sota_engine(filepath, total_nodes, node_data_json, mode_label):
             }});
         }}
         function closeModal() {{ document.getElementById('axiom-modal').classList.remove('active'); network.unselectAll(); }}
-        function renderLoop() {{ if (!physicsActive) network.redraw(); requestAnimationFrame(renderLoop); }}
+        function renderLoop(ts) {{
+            if (!physicsActive && (isDragging || ts - lastDraw > IDLE_FRAME_MS)) {{ network.redraw(); lastDraw = ts; }}
+            requestAnimationFrame(renderLoop);
+        }}
     </script>
     </body>
     """
-    html = html.replace("</body>", engine_js)
+    engine_head, _, engine_tail = engine_js.partition(_NODE_DATA_SLOT)
+    replacements = {
+        "background-color: #ffffff;": "",
+        "</head>": cyberpunk_css,
+    }
     with open(filepath, "w", encoding="utf-8") as file:
-        file.write(html)
+        pos = 0
+        for match in _INJECTION_POINTS.finditer(html):
+            file.write(html[pos : match.start()])
+            pos = match.end()
+            if match.group(0) == "</body>":
+                file.write(engine_head)
+                json.dump(
+                    node_data, file, separators=(",", ":"), ensure_ascii=False
+                )
+                file.write(engine_tail)
+            else:
+                file.write(replacements[match.group(0)])
+        file.write(html[pos:])
+
+
+def precompute_layout(node_ids, edges):
+    """Lay the graph out once in Python, or return None to leave it to vis.js.
+
+    A one-shot spring layout here means every viewer gets a static page
+    instead of re-running the physics simulation on each load. Large graphs
+    (or installs without networkx's numeric backends) fall back to the
+    in-browser solver. `edges` must only join ids in `node_ids`.
+    """
+    if len(node_ids) > LAYOUT_PRECOMPUTE_MAX_NODES:
+        return None
+    try:
+        import networkx as nx
+
+        graph = nx.Graph()
+        graph.add_nodes_from(node_ids)
+        graph.add_weighted_edges_from(
+            (e["from"], e["to"], e["value"]) for e in edges
+        )
+        positions = nx.spring_layout(graph, seed=42)
+    except ImportError:
+        return None
+    # spring_layout fits [-1, 1]; spread it like vis.js' springLength does.
+    scale = max(300.0, 60.0 * len(node_ids) ** 0.5)
+    return {
+        nid: (float(xy[0]) * scale, float(xy[1]) * scale)
+        for nid, xy in positions.items()
+    }
 
 
 def build_pyvis_html(out_path, data, mode_label, is_brain):
@@ -208,29 +329,43 @@ def build_pyvis_html(out_path, data, mode_label, is_brain):
     if not nodes:
         return
 
-    node_data_dict = {}
-    added_node_ids = set()
+    added_node_ids = {n["id"] for n in nodes}
+    edges = [
+        e
+        for e in edges
+        if e["from"] in added_node_ids and e["to"] in added_node_ids
+    ]
+    default_status = "brain" if is_brain else "uncorroborated"
 
-    for n in nodes:
-        added_node_ids.add(n["id"])
-        z = 200 if is_brain else (0 if n.get("status") == "trusted" else -200)
+    def _content(n):
         content = n.get("label") or n.get("full_content") or ""
         if isinstance(content, bytes):
             content = content.decode("utf-8", errors="replace")
-        node_data_dict[n["id"]] = {
-            "content": content,
-            "status": n.get(
-                "status",
-                "brain" if is_brain else "uncorroborated",
-            ),
-            "value": n["value"],
-            "source": n.get("source_url", "") or "",
-            "is_brain": is_brain,
-            "color": get_node_colors(n.get("status", ""), is_brain),
-            "z": z,
-        }
+        return content
+
+    # Struct-of-arrays payload: the page indexes these by node slot.
+    node_data_dict = {
+        "ids": [n["id"] for n in nodes],
+        "statuses": [n.get("status", default_status) for n in nodes],
+        "values": [n["value"] for n in nodes],
+        "zs": [
+            200 if is_brain else (0 if n.get("status") == "trusted" else -200)
+            for n in nodes
+        ],
+        "colors": [get_node_colors(n.get("status"), is_brain) for n in nodes],
+        "contents": [_content(n) for n in nodes],
+        "sources": [n.get("source_url", "") or "" for n in nodes],
+        "isBrain": is_brain,
+    }
 
-    net = Network(height="100vh", width="100%", bgcolor="#000000")
+    layout = precompute_layout(added_node_ids, edges)
+    theta = 0.5 if len(nodes) <= BARNES_HUT_FINE_MAX_NODES else 0.8
+    net = Network(
+        height="100vh",
+        width="100%",
+        bgcolor="#000000",
+        cdn_resources="remote",
+    )
     vis_options = {
         "nodes": {
             "color": "rgba(0,0,0,0)",
@@ -240,8 +375,13 @@ def build_pyvis_html(out_path, data, mode_label, is_brain):
         },
         "edges": {"color": "rgba(0,0,0,0)", "shadow": {"enabled": False}},
         "physics": {
+            "enabled": layout is None,
             "solver": "forceAtlas2Based",
+            # vis-network's forceAtlas2Based repulsion runs on a Barnes-Hut
+            # quadtree; a coarser opening angle on big graphs trades a little
+            # layout precision for far fewer force evaluations.
             "forceAtlas2Based": {
+                "theta": theta,
                 "gravitationalConstant": -150,
                 "centralGravity": 0.02,
                 "springLength": 200,
@@ -256,18 +396,32 @@ def build_pyvis_html(out_path, data, mode_label, is_brain):
     net.set_options(json.dumps(vis_options))
 
     for n in nodes:
-        net.add_node(n["id"], label=" ", value=n["value"], size=25)
-
+        if layout is None:
+            net.add_node(n["id"], label=" ", value=n["value"], size=25)
+        else:
+            x, y = layout[n["id"]]
+            net.add_node(
+                n["id"], label=" ", value=n["value"], size=25, x=x, y=y
+            )
+
+    # Only the strongest edges are drawn; thinning here keeps the rest out
+    # of the HTML and out of the renderer's per-frame loop entirely.
+    if len(edges) > MAX_RENDERED_EDGES:
+        edges = heapq.nlargest(
+            MAX_RENDERED_EDGES, edges, key=lambda e: e["value"]
+        )
     for e in edges:
-        if e["from"] in added_node_ids and e["to"] in added_node_ids:
-            net.add_edge(e["from"], e["to"], value=e["value"])
+        net.add_edge(e["from"], e["to"], value=e["value"])
 
-    net.save_graph(out_path)
+    # generate_html() renders pyvis's page in memory; inject_sota_engine
+    # writes it once, instead of save_graph() writing it only to be re-read.
     inject_sota_engine(
         out_path,
+        net.generate_html(),
         len(nodes),
-        json.dumps(node_data_dict),
+        node_data_dict,
         mode_label,
+        layout_precomputed=layout is not None,
     )
 
 